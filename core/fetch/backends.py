@@ -0,0 +1,33 @@
+from core.fetch.base import FallbackBackend
+from core.fetch.http_backend import HttpBackend
+from core.fetch.network_backend import NetworkBackend
+from core.fetch.selenium_backend import SeleniumBackend
+
+# Fetch backends by name
+BACKENDS = {
+    "selenium": SeleniumBackend,
+    "network": NetworkBackend,
+    "http": HttpBackend,
+}
+
+
+def get_backend(
+    name, fallback=True, profile="full", headless=False, browser_profile="default"
+):
+    """
+    Return a fetch backend by name.
+
+    Backends other than selenium retry failed lookups by scraping the page
+    unless fallback is False. The profile (see profiles.py) sets the fields
+    the records hold. Browsers run without a window when headless is True
+    and with the Chrome options of the browser profile (browser_profiles.py).
+    """
+    if issubclass(BACKENDS[name], SeleniumBackend):
+        backend = BACKENDS[name](profile, headless, browser_profile)
+    else:
+        backend = BACKENDS[name](profile)
+    if fallback and name != "selenium":
+        return FallbackBackend(
+            backend, SeleniumBackend(profile, headless, browser_profile)
+        )
+    return backend
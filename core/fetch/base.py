@@ -0,0 +1,138 @@
+"""
+Fetch backends look up one plate on the RDW and return its vehicle record.
+
+A record is a dict with the fields below, already parsed: dates are
+datetime.date, exported and insurance are booleans, fuel_list is a list
+of fuel names. Text fields keep the format the OVI page shows, so the
+save step (core/utilities/save_vehicle.py) does not depend on the backend.
+"""
+
+# Python imports
+from collections import deque
+
+# Django Imports
+from django.conf import settings
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.utilities.scan_result import ERROR
+
+# Lookups the fallback rate of a FallbackBackend is measured over
+FALLBACK_WINDOW = 50
+
+RECORD_FIELDS = (
+    "make_raw",  # "Volkswagen"
+    "model_raw",  # "Golf"
+    "color",  # "Grijs", None if not registered
+    "category_raw",  # "Personenauto (M1)"
+    "body_type_raw",  # "Hatchback (AB)"
+    "first_reg",
+    "first_reg_in_NL",
+    "imported_in_NL",
+    "apk",
+    "curb_weight",
+    "empty_weight",
+    "max_weight_tech",
+    "max_weight_legal",
+    "gross_combination_weight",
+    "trailer_with_brakes",
+    "trailer_without_brakes",
+    "exported",
+    "insurance",
+    "engine_volume",
+    "cylinder_count",
+    "fuel_list",
+    "kw",
+    "kw2",
+)
+
+
+class FetchBackend:
+    """
+    Interface of a fetch backend.
+
+    open() is called once before the first lookup and close() once after
+    the last one. fetch(plate) returns (result, record): HIT with the
+    record, MISS when the RDW has no vehicle for the plate, or ERROR with
+    None when the lookup failed and should be retried later.
+
+    Backends take an extraction profile (core/fetch/profiles.py), records
+    only hold the fields of that profile. A field the backend cannot
+    supply is left out of the record, the save step keeps the stored value.
+    """
+
+    name = ""
+
+    def open(self):
+        """Prepare the backend for lookups."""
+
+    def fetch(self, plate):
+        """Look up a plate, returns (result, record)."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release everything open() acquired."""
+
+    def session_metrics(self):
+        """Health metrics of the open session, see core/fetch/supervisor.py."""
+        return {}
+
+
+class FallbackBackend(FetchBackend):
+    """
+    Use a primary backend and retry failed lookups with a fallback backend.
+
+    A primary backend that fails most lookups only adds latency, so
+    a warning is printed when more than FETCH_FALLBACK_WARN_RATE of the last
+    FALLBACK_WINDOW lookups fell back.
+    """
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+        self.name = f"{primary.name}+{fallback.name}"
+        self.fallback_open = False
+        self.fell_back = deque(maxlen=FALLBACK_WINDOW)
+
+    def fallback_rate(self):
+        """Share of the recent lookups that fell back, None if too few."""
+        if len(self.fell_back) < FALLBACK_WINDOW:
+            return None
+        return sum(self.fell_back) / len(self.fell_back)
+
+    def open(self):
+        self.primary.open()
+
+    def fetch(self, plate):
+        result, record = self.primary.fetch(plate)
+        self.fell_back.append(result == ERROR)
+        if result != ERROR:
+            return result, record
+        print(
+            f"Lookup failed with {self.primary.name}, retrying with {self.fallback.name}"
+        )
+        rate = self.fallback_rate()
+        if rate is not None and rate > settings.FETCH_FALLBACK_WARN_RATE:
+            print(
+                f"{Fore.RED}Warning: {rate:.0%} of the last {FALLBACK_WINDOW} lookups fell back from {self.primary.name} to {self.fallback.name}{Style.RESET_ALL}"
+            )
+            # Warn once per window
+            self.fell_back.clear()
+        # The fallback (a browser) is only started when it is needed
+        if not self.fallback_open:
+            self.fallback.open()
+            self.fallback_open = True
+        return self.fallback.fetch(plate)
+
+    def close(self):
+        self.primary.close()
+        if self.fallback_open:
+            self.fallback.close()
+            self.fallback_open = False
+
+    def session_metrics(self):
+        metrics = self.primary.session_metrics()
+        if self.fallback_open:
+            metrics.update(self.fallback.session_metrics())
+        return metrics
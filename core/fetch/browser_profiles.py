@@ -0,0 +1,80 @@
+"""
+Chrome profiles of the selenium backends.
+
+The OVI page pulls in images, fonts and analytics the scraper never looks
+at. The lean profile runs headless, without extensions, with a disk cache
+shared between sessions and blocks those requests through the DevTools
+protocol (Network.setBlockedURLs). Stylesheets stay, the waits depend on
+what the page shows and hides.
+"""
+
+# Django Imports
+from django.conf import settings
+
+BROWSER_PROFILES = {
+    "default": {
+        "headless": False,
+        "arguments": (),
+        "preferences": {},
+        "blocked_urls": (),
+    },
+    "lean": {
+        "headless": True,
+        "arguments": (
+            "--disable-extensions",
+            "--disable-gpu",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-networking",
+            "--disable-sync",
+            "--mute-audio",
+            "--blink-settings=imagesEnabled=false",
+        ),
+        "preferences": {
+            "profile.managed_default_content_settings.images": 2,
+        },
+        "blocked_urls": (
+            # Images and fonts
+            "*.png",
+            "*.jpg",
+            "*.jpeg",
+            "*.gif",
+            "*.svg",
+            "*.ico",
+            "*.webp",
+            "*.woff",
+            "*.woff2",
+            "*.ttf",
+            "*.otf",
+            # Third-party analytics and tag managers
+            "*google-analytics.com*",
+            "*googletagmanager.com*",
+            "*doubleclick.net*",
+            "*siteimprove*",
+            "*hotjar*",
+            "*piwik*",
+            "*matomo*",
+        ),
+    },
+}
+
+
+def apply_chrome_options(options, browser_profile):
+    """Add the arguments and preferences of a browser profile to ChromeOptions."""
+    profile = BROWSER_PROFILES[browser_profile]
+    for argument in profile["arguments"]:
+        options.add_argument(argument)
+    if profile["preferences"]:
+        options.add_experimental_option("prefs", profile["preferences"])
+    if profile["blocked_urls"]:
+        # Sessions of the lean profile share one disk cache
+        options.add_argument(f"--disk-cache-dir={settings.BROWSER_CACHE_DIR}")
+    return options
+
+
+def apply_request_blocking(driver, browser_profile):
+    """Block the requests the browser profile does not need in a new session."""
+    blocked_urls = BROWSER_PROFILES[browser_profile]["blocked_urls"]
+    if blocked_urls:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(blocked_urls)})
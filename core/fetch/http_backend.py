@@ -0,0 +1,191 @@
+# Python imports
+import json
+from datetime import datetime
+
+import urllib3
+
+# Django Imports
+from django.conf import settings
+
+from core.fetch.base import FetchBackend
+from core.fetch.profiles import PROFILES, apply_profile
+from core.utilities.scan_result import HIT, MISS, ERROR
+from vehicles.models import Make, Model
+
+# RDW open data datasets (Socrata resources) with the OVI data of a plate
+VEHICLES_DATASET = "m9d7-ebf2"
+FUEL_DATASET = "8ys7-d773"
+BODY_DATASET = "vezc-m2t6"
+
+
+def parse_date(value):
+    """Parse an open data date like "20190315", None if missing."""
+    try:
+        return datetime.strptime(value, "%Y%m%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def with_unit(value, unit):
+    """Format a number the way the OVI page shows it, e.g. "1.250 kg"."""
+    try:
+        number = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return f"{number:,} {unit}".replace(",", ".")
+
+
+def ovi_spelling(make_raw, model_raw):
+    """
+    Spell an open data make and model ("VOLKSWAGEN", "GOLF") the way the OVI
+    page does, so they match the Make and Model rows saved from OVI lookups.
+    Known spellings are reused, new ones are title-cased.
+    """
+    make = (
+        Make.objects.filter(raw_make__iexact=make_raw)
+        .values_list("raw_make", flat=True)
+        .first()
+    ) or make_raw.title()
+    model = (
+        Model.objects.filter(make__raw_make=make, raw_model__iexact=model_raw)
+        .values_list("raw_model", flat=True)
+        .first()
+    ) or model_raw.title()
+    return make, model
+
+
+def open_data_record(vehicle, fuels, bodies):
+    """Map open data rows onto the fields of a vehicle record."""
+    fuels = sorted(fuels, key=lambda fuel: int(fuel.get("brandstof_volgnummer", 0)))
+    fuel_list = [fuel.get("brandstof_omschrijving") for fuel in fuels] or None
+    power = [with_unit(fuel.get("nettomaximumvermogen"), "kW") for fuel in fuels]
+
+    category_raw = "Undefined (NA)"
+    if vehicle.get("voertuigsoort") and vehicle.get("europese_voertuigcategorie"):
+        category_raw = (
+            f"{vehicle['voertuigsoort']} ({vehicle['europese_voertuigcategorie']})"
+        )
+    body_type_raw = "Undefined (NA)"
+    if bodies:
+        body = bodies[0]
+        body_type_raw = f"{body.get('type_carrosserie_europese_omschrijving')} ({body.get('carrosserietype')})"
+
+    color = vehicle.get("eerste_kleur")
+    cylinder_count = vehicle.get("aantal_cilinders")
+    if cylinder_count and len(cylinder_count) > 2:
+        cylinder_count = "NA"
+
+    make_raw, model_raw = ovi_spelling(
+        vehicle.get("merk", ""), vehicle.get("handelsbenaming", "")
+    )
+
+    # Fields open data does not publish (imported_in_NL) are left out, so
+    # the save step keeps what an OVI lookup stored for them.
+    return {
+        "make_raw": make_raw,
+        "model_raw": model_raw,
+        "color": None if color in (None, "Niet geregistreerd") else color,
+        "category_raw": category_raw,
+        "body_type_raw": body_type_raw,
+        "first_reg": parse_date(vehicle.get("datum_eerste_toelating")),
+        "first_reg_in_NL": parse_date(
+            vehicle.get("datum_eerste_tenaamstelling_in_nederland")
+        ),
+        "apk": parse_date(vehicle.get("vervaldatum_apk")),
+        "curb_weight": with_unit(vehicle.get("massa_rijklaar"), "kg"),
+        "empty_weight": with_unit(vehicle.get("massa_ledig_voertuig"), "kg"),
+        "max_weight_tech": with_unit(
+            vehicle.get("technische_max_massa_voertuig"), "kg"
+        ),
+        "max_weight_legal": with_unit(
+            vehicle.get("toegestane_maximum_massa_voertuig"), "kg"
+        ),
+        "gross_combination_weight": with_unit(
+            vehicle.get("maximum_massa_samenstelling"), "kg"
+        ),
+        "trailer_with_brakes": with_unit(
+            vehicle.get("maximum_trekken_massa_geremd"), "kg"
+        ),
+        "trailer_without_brakes": with_unit(
+            vehicle.get("maximum_massa_trekken_ongeremd"), "kg"
+        ),
+        "exported": vehicle.get("export_indicator") != "Nee",
+        "insurance": vehicle.get("wam_verzekerd") != "Nee",
+        "engine_volume": with_unit(vehicle.get("cilinderinhoud"), "cc"),
+        "cylinder_count": cylinder_count,
+        "fuel_list": fuel_list,
+        "kw": power[0] if power else None,
+        "kw2": power[1] if len(power) > 1 else None,
+    }
+
+
+def profile_datasets(profile):
+    """Return the open data datasets a lookup with the profile has to read."""
+    fields = set(PROFILES[profile])
+    datasets = [VEHICLES_DATASET]
+    # Fuel and body type are in datasets of their own
+    if fields & {"fuel_list", "kw", "kw2"}:
+        datasets.append(FUEL_DATASET)
+    if "body_type_raw" in fields:
+        datasets.append(BODY_DATASET)
+    return datasets
+
+
+class HttpBackend(FetchBackend):
+    """
+    Look plates up with plain HTTP requests to the RDW open data API.
+
+    The OVI page shows the same registration data, so no browser is needed.
+    The base URL comes from settings.RDW_OPEN_DATA_URL and can point at a
+    local stand-in server (see the rdw_stub_server command).
+    """
+
+    name = "http"
+
+    def __init__(self, profile="full", base_url=None, timeout=10):
+        self.profile = profile
+        self.base_url = (base_url or settings.RDW_OPEN_DATA_URL).rstrip("/")
+        self.timeout = timeout
+        self.http = None
+
+    def open(self):
+        headers = {"Accept": "application/json"}
+        if settings.RDW_APP_TOKEN:
+            headers["X-App-Token"] = settings.RDW_APP_TOKEN
+        self.http = urllib3.PoolManager(
+            headers=headers,
+            timeout=urllib3.Timeout(total=self.timeout),
+            retries=urllib3.Retry(total=2, backoff_factor=0.5),
+        )
+
+    def close(self):
+        if self.http is not None:
+            self.http.clear()
+            self.http = None
+
+    def get_rows(self, dataset, plate):
+        """Return the rows of a dataset for a plate."""
+        response = self.http.request(
+            "GET", f"{self.base_url}/{dataset}.json", fields={"kenteken": plate}
+        )
+        if response.status != 200:
+            raise ValueError(f"HTTP {response.status} from {dataset}")
+        return json.loads(response.data)
+
+    def fetch(self, plate):
+        try:
+            vehicles = self.get_rows(VEHICLES_DATASET, plate)
+            if not vehicles:
+                return MISS, None
+            datasets = profile_datasets(self.profile)
+            fuels, bodies = [], []
+            if FUEL_DATASET in datasets:
+                fuels = self.get_rows(FUEL_DATASET, plate)
+            if BODY_DATASET in datasets:
+                bodies = self.get_rows(BODY_DATASET, plate)
+        except (urllib3.exceptions.HTTPError, ValueError) as e:
+            print(f"Lookup of {plate} failed: {e}")
+            return ERROR, None
+
+        record = open_data_record(vehicles[0], fuels, bodies)
+        return HIT, apply_profile(record, self.profile)
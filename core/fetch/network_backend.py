@@ -0,0 +1,163 @@
+# Python imports
+import json
+import os
+import time as t
+
+# Selenium Imports
+from selenium.common.exceptions import WebDriverException
+
+from core.fetch.http_backend import (
+    BODY_DATASET,
+    FUEL_DATASET,
+    VEHICLES_DATASET,
+    open_data_record,
+    profile_datasets,
+)
+from core.fetch.profiles import apply_profile
+from core.fetch.selenium_backend import SeleniumBackend
+from core.utilities.scan_result import HIT, MISS, ERROR
+
+# Part of the URL of the OVI API responses that hold the vehicle data
+OVI_API_PATH = "/api/"
+
+# Performance log and response bodies of one lookup, written by the
+# record_ovi_log command and replayed by the tests
+RECORDING_PATH = os.path.join(os.path.dirname(__file__), "ovi_network_fixture.json")
+
+# The OVI API serves the open data datasets, their ids tell the vehicle,
+# fuel and body responses apart
+API_DATASETS = (VEHICLES_DATASET, FUEL_DATASET, BODY_DATASET)
+
+
+def response_dataset(url, plate):
+    """Return the dataset of an OVI API response for the plate, else None."""
+    if OVI_API_PATH not in url or plate not in url.upper().replace("-", ""):
+        return None
+    for dataset in API_DATASETS:
+        if dataset in url:
+            return dataset
+    return None
+
+
+def find_rows(payload, key):
+    """Return every object in a JSON payload that has the given key."""
+    rows = []
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if key in value:
+                rows.append(value)
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+    return rows
+
+
+def payload_record(payloads):
+    """
+    Map the JSON responses of one lookup onto a vehicle record.
+
+    Args:
+        payloads (list): Decoded JSON bodies of the OVI API responses.
+
+    Returns:
+        dict: The vehicle record, or None if no response held a vehicle.
+    """
+    vehicles, fuels, bodies = [], [], []
+    for payload in payloads:
+        vehicles += find_rows(payload, "merk")
+        fuels += find_rows(payload, "brandstof_omschrijving")
+        bodies += find_rows(payload, "carrosserietype")
+    if not vehicles:
+        return None
+    return open_data_record(vehicles[0], fuels, bodies)
+
+
+class NetworkBackend(SeleniumBackend):
+    """
+    Look plates up in Chrome but read the vehicle JSON from the network log.
+
+    The OVI page renders from API responses. Chrome's performance log tells
+    which responses belong to the lookup and the DevTools protocol returns
+    their bodies once they finished loading, so no accordion has to be
+    opened and read back from the DOM. Only the vehicle response decides a
+    MISS, a lookup is complete once the fuel and body responses the profile
+    needs are in too.
+    """
+
+    name = "network"
+
+    def __init__(
+        self, profile="full", headless=False, browser_profile="default", timeout=10
+    ):
+        super().__init__(profile, headless, browser_profile)
+        self.timeout = timeout
+
+    def chrome_options(self):
+        options = super().chrome_options()
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        return options
+
+    def network_events(self):
+        """Yield the Network.* messages logged since the last call."""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message["method"] in (
+                "Network.responseReceived",
+                "Network.loadingFinished",
+            ):
+                yield message["method"], message["params"]
+
+    def response_body(self, request_id):
+        """Return the decoded JSON body of a response, None if unavailable."""
+        try:
+            body = self.driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request_id}
+            )
+            return json.loads(body["body"])
+        except (WebDriverException, ValueError):
+            return None
+
+    def scrape(self, plate):
+        # Drop the log entries of earlier lookups
+        self.driver.get_log("performance")
+        self.search(plate)
+
+        datasets = profile_datasets(self.profile)
+        # get_log() drains the log, so the responses seen so far are kept
+        # until their body has finished loading
+        pending = {}
+        payloads = {}
+        deadline = t.monotonic() + self.timeout
+        while t.monotonic() < deadline:
+            for method, params in self.network_events():
+                request_id = params["requestId"]
+                if method == "Network.responseReceived":
+                    response = params["response"]
+                    dataset = response_dataset(response["url"], plate)
+                    if dataset in datasets:
+                        pending[request_id] = (dataset, response["status"])
+                    continue
+                if request_id not in pending:
+                    continue
+                dataset, status = pending.pop(request_id)
+                payload = None
+                if status == 404:
+                    payload = []
+                elif status == 200:
+                    payload = self.response_body(request_id)
+                if dataset == VEHICLES_DATASET and payload in ([], {}):
+                    # The API has no vehicle for the plate
+                    return MISS, None
+                if payload is not None:
+                    payloads[dataset] = payload
+            if all(dataset in payloads for dataset in datasets):
+                break
+            t.sleep(0.25)
+
+        record = payload_record(payloads.values())
+        if record is None or len(payloads) < len(datasets):
+            print(f"No complete vehicle response captured for license plate: {plate}")
+            return ERROR, None
+        return HIT, apply_profile(record, self.profile)
@@ -0,0 +1,135 @@
+"""
+A pool of warm fetch backends (browser sessions) looking plates up in parallel.
+
+Every backend belongs to one worker thread for the whole run, so a browser
+is only ever driven by one thread. Workers only look plates up and hand
+(result, record) to a single queue the calling thread drains; saving
+vehicles, the scan state maps and the cursor are only touched there.
+"""
+
+# Python imports
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Django Imports
+from django.db import connections
+
+from core.utilities.scan_result import ERROR
+
+
+class BackendPool:
+    """
+    Keep `size` fetch backends open and run lookups on them in parallel.
+
+    Args:
+        make_backend: Callable returning a new, unopened fetch backend.
+        size (int): Number of backends (and worker threads).
+    """
+
+    def __init__(self, make_backend, size=1):
+        self.backends = [make_backend() for _ in range(max(size, 1))]
+        self.stopping = threading.Event()
+
+    @property
+    def name(self):
+        return f"{len(self.backends)}x {self.backends[0].name}"
+
+    def open(self):
+        """Open all backends at the same time, browsers start slowly."""
+        with ThreadPoolExecutor(max_workers=len(self.backends)) as executor:
+            list(executor.map(lambda backend: backend.open(), self.backends))
+
+    def close(self):
+        for backend in self.backends:
+            backend.close()
+
+    def stop(self):
+        """Let the workers finish their current plate and take no new ones."""
+        self.stopping.set()
+
+    def work(self, backend, process, tasks, results):
+        """Worker loop: look up plates from tasks until it is empty."""
+        try:
+            while not self.stopping.is_set():
+                try:
+                    key, plate = tasks.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    outcome = process(backend, plate)
+                except Exception as e:
+                    print(f"Lookup of {plate} failed: {e}")
+                    outcome = ERROR, None
+                results.put((key, plate, outcome))
+        finally:
+            # A read in process() opens a database connection for this thread
+            connections.close_all()
+            results.put(None)
+
+    def run(self, process, items):
+        """
+        Look up plates in parallel.
+
+        Args:
+            process: Callable (backend, plate) -> (result, record) like
+                FetchBackend.fetch, run by the workers. It may read but
+                must not write the database.
+            items (iterable): (key, plate) pairs.
+
+        Yields:
+            tuple: (key, plate, (result, record)) in the order the lookups
+            finish.
+        """
+        tasks = queue.Queue()
+        for item in items:
+            tasks.put(item)
+        results = queue.Queue()
+        workers = [
+            threading.Thread(
+                target=self.work,
+                args=(backend, process, tasks, results),
+                name=f"lookup-{number}",
+                daemon=True,
+            )
+            for number, backend in enumerate(self.backends, start=1)
+        ]
+        for worker in workers:
+            worker.start()
+
+        running = len(workers)
+        try:
+            while running:
+                item = results.get()
+                if item is None:
+                    running -= 1
+                else:
+                    yield item
+        finally:
+            self.stop()
+            for worker in workers:
+                worker.join()
+            self.stopping.clear()
+
+
+class CompletedPrefix:
+    """
+    Track which keys of an ordered batch are done, for a resumable cursor.
+
+    Lookups finish out of order, a cursor may only move past a key once
+    every key before it is done as well.
+    """
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self.done = set()
+        self.position = 0
+
+    def complete(self, key):
+        """Mark a key done, returns the new last key of the done prefix or None."""
+        self.done.add(key)
+        last = None
+        while self.position < len(self.keys) and self.keys[self.position] in self.done:
+            last = self.keys[self.position]
+            self.position += 1
+        return last
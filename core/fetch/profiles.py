@@ -0,0 +1,87 @@
+"""
+Extraction profiles: the record fields a lookup needs.
+
+The OVI page hides most fields in accordions and tabs that have to be
+opened one by one. A profile lists the fields a command needs, so the
+selenium backend only opens the sections holding them.
+"""
+
+from core.fetch.base import RECORD_FIELDS
+
+# Sections of the OVI page in page order, with the toggles opening them, the
+# toggles opened only if the vehicle has them and the fields they hold.
+# Sections on another tab than the overview are read separately and are
+# missing for some vehicles.
+SECTIONS = {
+    "overview": {
+        "toggles": (),
+        "optional_toggles": (),
+        "fields": ("color", "category_raw", "body_type_raw"),
+    },
+    "history": {
+        "toggles": ("acc-overzicht-verval-historie-toggle",),
+        "optional_toggles": (),
+        "fields": ("first_reg", "first_reg_in_NL", "imported_in_NL", "apk"),
+    },
+    "weights": {
+        "toggles": ("acc-overzicht-gewichten-toggle",),
+        "optional_toggles": (),
+        "fields": (
+            "curb_weight",
+            "empty_weight",
+            "max_weight_tech",
+            "max_weight_legal",
+            "gross_combination_weight",
+            "trailer_with_brakes",
+            "trailer_without_brakes",
+        ),
+    },
+    "status": {
+        "toggles": ("acc-overzicht-status-toggle",),
+        "optional_toggles": (),
+        "fields": ("exported", "insurance"),
+    },
+    "engine": {
+        "toggles": ("tab-motor-milieu", "acc-motor-milleu-prestaties-toggle"),
+        "optional_toggles": (
+            # One table per fuel when the vehicle has more than one
+            "acc-brandstof-milieu-tabel-brandstof-milieu-tabel-1-toggle",
+            "acc-brandstof-milieu-tabel-brandstof-milieu-tabel-2-toggle",
+        ),
+        "tab": True,
+        "fields": ("engine_volume", "cylinder_count", "fuel_list", "kw", "kw2"),
+    },
+}
+
+# The make and model in the page header are always read, they show the
+# lookup found a vehicle
+PROFILES = {
+    "full": RECORD_FIELDS,
+    "apk": (
+        "make_raw",
+        "model_raw",
+        "first_reg",
+        "first_reg_in_NL",
+        "imported_in_NL",
+        "apk",
+        "exported",
+        "insurance",
+    ),
+    "status-only": ("make_raw", "model_raw", "exported", "insurance"),
+}
+
+
+def get_sections(profile):
+    """Return the names of the sections a profile needs, in page order."""
+    fields = set(PROFILES[profile])
+    return [
+        name for name, section in SECTIONS.items() if fields & set(section["fields"])
+    ]
+
+
+def apply_profile(record, profile):
+    """
+    Return only the fields of a record the profile asks for. Fields the
+    backend could not supply stay missing rather than becoming None.
+    """
+    return {field: record[field] for field in PROFILES[profile] if field in record}
@@ -0,0 +1,328 @@
+# Selenium Imports
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.fetch.base import FetchBackend
+from core.fetch.browser_profiles import (
+    BROWSER_PROFILES,
+    apply_chrome_options,
+    apply_request_blocking,
+)
+from core.fetch.profiles import SECTIONS, apply_profile, get_sections
+from core.fetch.waits import (
+    NO_DATA_NOTIFICATION,
+    VEHICLE_FOUND,
+    VEHICLE_TRADE_NAME,
+    aria_state,
+    mark_results_stale,
+    wait_for_expanded,
+    wait_for_result,
+    wait_for_search_field,
+)
+from core.utilities.get_table_element import get_label, get_labels
+from core.utilities.get_date import get_date as get_date
+from core.utilities.scan_result import HIT, MISS, ERROR
+from core.utilities.step_latency import timed_step
+
+OVI_URL = "https://ovi.rdw.nl/"
+# Tab of the OVI page with the general data, next to the engine tab
+OVERVIEW_TAB = "tab-overzicht"
+
+
+def label_record(make_raw, model_raw, labels, engine_labels):
+    """
+    Map the labels read from the OVI page onto a vehicle record.
+
+    Args:
+        make_raw (str): The make in the page header.
+        model_raw (str): The trade name in the page header.
+        labels (dict): get_labels of the overview tab.
+        engine_labels (dict): get_labels of the engine tab, None without one.
+
+    Returns:
+        dict: The vehicle record.
+    """
+    for field_name in ["Carrosserietype", "Speciale doeleinden"]:
+        body_type_raw = get_label(labels, field_name)
+        if body_type_raw is not None:
+            break
+    else:
+        body_type_raw = "Undefined (NA)"
+
+    engine_volume = cylinder_count = fuel_list = kw = kw2 = None
+    if engine_labels is not None:
+        engine_volume = get_label(engine_labels, "Cilinderinhoud")
+        cylinder_count = get_label(engine_labels, "Aantal cilinders")
+        if cylinder_count and len(cylinder_count) > 2:
+            cylinder_count = "NA"
+        # The first fuel table repeats the summary, the last one is the 2nd fuel
+        fuel_list = list(dict.fromkeys(engine_labels.get("Brandstof", [])))
+        kw = get_label(engine_labels, "Nettomaximumvermogen")
+        if len(fuel_list) > 1:
+            kw2 = get_label(engine_labels, "Nettomaximumvermogen", -1)
+        print(f"Fuel types found: {fuel_list}")
+
+    return {
+        "make_raw": make_raw,
+        "model_raw": model_raw,
+        "color": get_label(labels, "Kleur"),
+        "category_raw": get_label(labels, "Voertuigcategorie"),
+        "body_type_raw": body_type_raw,
+        "first_reg": get_date(get_label(labels, "Datum eerste toelating")),
+        "first_reg_in_NL": get_date(
+            get_label(labels, "Datum eerste tenaamstelling in Nederland")
+        ),
+        "imported_in_NL": get_date(
+            get_label(labels, "Datum inschrijving voertuig in Nederland")
+        ),
+        "apk": get_date(get_label(labels, "Vervaldatum APK")),
+        "curb_weight": get_label(labels, "Massa rijklaar"),
+        "empty_weight": get_label(labels, "Massa ledig voertuig"),
+        "max_weight_tech": get_label(labels, "Technische max. massa voertuig"),
+        "max_weight_legal": get_label(labels, "Toegestane max. massa voertuig"),
+        "gross_combination_weight": get_label(labels, "Maximum massa samenstel"),
+        "trailer_with_brakes": get_label(labels, "Aanhangwagen geremd"),
+        "trailer_without_brakes": get_label(labels, "Aanhangwagen ongeremd"),
+        "exported": get_label(labels, "Geëxporteerd") != "Nee",
+        "insurance": get_label(labels, "WAM-verzekerd") != "Nee",
+        "engine_volume": engine_volume,
+        "cylinder_count": cylinder_count,
+        "fuel_list": fuel_list or None,
+        "kw": kw,
+        "kw2": kw2,
+    }
+
+
+class SeleniumBackend(FetchBackend):
+    """Look plates up by driving the OVI page in Chrome."""
+
+    name = "selenium"
+
+    def __init__(self, profile="full", headless=False, browser_profile="default"):
+        self.driver = None
+        self.profile = profile
+        self.browser_profile = browser_profile
+        self.headless = headless or BROWSER_PROFILES[browser_profile]["headless"]
+        # Lookups, full page loads and refreshes since the browser was opened
+        self.pages = 0
+        self.reloads = 0
+        self.refreshes = 0
+        # Whether the OVI app is loaded and can take the next plate in place,
+        # whether it shows another tab than the overview and whether taking
+        # plates in place works at all on this page
+        self.page_ready = False
+        self.on_tab = False
+        self.in_place = True
+
+    def open(self):
+        print(Fore.YELLOW + "Opening browser..." + Style.RESET_ALL)
+        self.driver = self.create_driver()
+        self.pages = 0
+        self.reloads = 0
+        self.refreshes = 0
+        self.page_ready = False
+        self.on_tab = False
+        self.in_place = True
+        # Lets session_metrics read the memory use of the page
+        self.driver.execute_cdp_cmd("Performance.enable", {})
+        apply_request_blocking(self.driver, self.browser_profile)
+        self.driver.get(OVI_URL)
+        print(Fore.GREEN + "Browser open" + Style.RESET_ALL)
+
+    def chrome_options(self):
+        """Options of the Chrome session."""
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+        return apply_chrome_options(options, self.browser_profile)
+
+    def create_driver(self):
+        """Start the Chrome driver used for lookups."""
+        return webdriver.Chrome(options=self.chrome_options())
+
+    def close(self):
+        if self.driver is not None:
+            print(Fore.YELLOW + "Closing browser..." + Style.RESET_ALL)
+            self.driver.quit()
+            self.driver = None
+
+    def session_metrics(self):
+        """Pages, refreshes and the JavaScript heap and DOM size of the browser."""
+        metrics = {
+            "pages": self.pages,
+            "reloads": self.reloads,
+            "refreshes": self.refreshes,
+        }
+        try:
+            values = {
+                metric["name"]: metric["value"]
+                for metric in self.driver.execute_cdp_cmd("Performance.getMetrics", {})[
+                    "metrics"
+                ]
+            }
+        except (AttributeError, KeyError, WebDriverException):
+            return metrics
+        metrics["heap_mb"] = round(values.get("JSHeapTotalSize", 0) / 2**20, 1)
+        metrics["dom_nodes"] = int(values.get("Nodes", 0))
+        return metrics
+
+    def find_search_field(self, max_retries=3):
+        """Return the licence plate field, refreshing the page if it is missing."""
+        for attempt in range(1, max_retries + 1):
+            try:
+                return wait_for_search_field(self.driver)
+            except TimeoutException:
+                print(f"Attempt {attempt} failed. Refreshing the page...")
+                self.refreshes += 1
+                self.driver.refresh()
+        raise Exception(f"Licence plate field not found after {max_retries} attempts.")
+
+    def search(self, plate):
+        """
+        Search for a license plate.
+
+        The OVI app stays loaded between lookups and takes the next plate in
+        its search field. The page is only loaded again when page_ready is
+        False, after a lookup left the page in a bad state, and for every
+        lookup once the page turned out to lose its search field.
+        """
+        driver = self.driver
+
+        kenteken_input = None
+        if self.page_ready and self.in_place:
+            try:
+                if self.on_tab:
+                    self.open_accordion(OVERVIEW_TAB)
+                    self.on_tab = False
+                mark_results_stale(driver)
+                kenteken_input = wait_for_search_field(driver)
+            except (NoSuchElementException, TimeoutException):
+                print("The OVI page can not take plates in place, reloading it...")
+                self.in_place = False
+        if kenteken_input is None:
+            with timed_step("load_page"):
+                driver.get(OVI_URL)
+            self.reloads += 1
+            self.on_tab = False
+            kenteken_input = self.find_search_field()
+        self.pages += 1
+
+        # Fill in the license plate, replacing the one of the last lookup
+        kenteken_input.clear()
+        kenteken_input.send_keys(Keys.CONTROL, "a")
+        kenteken_input.send_keys(Keys.DELETE)
+        kenteken_input.send_keys(plate)
+
+        # Click the search button
+        search_btn = driver.find_element(By.CLASS_NAME, "icon-search")
+        search_btn.click()
+
+    def open_accordion(self, element_id):
+        """Expand an accordion or tab of the OVI page and wait until it is open."""
+        toggle = self.driver.find_element(By.ID, element_id)
+        if aria_state(toggle):
+            # Still open from the last lookup on this page
+            return
+        toggle.click()
+        wait_for_expanded(self.driver, toggle)
+
+    def open_section(self, section):
+        """Open the toggles of a section of the OVI page (see profiles.py)."""
+        for element_id in section["toggles"]:
+            self.open_accordion(element_id)
+        for element_id in section["optional_toggles"]:
+            try:
+                self.open_accordion(element_id)
+            except NoSuchElementException:
+                break
+
+    def read_labels(self):
+        """get_labels of the page, timed as a step."""
+        with timed_step("read_labels"):
+            return get_labels(self.driver)
+
+    def fetch(self, plate):
+        with timed_step("lookup"):
+            try:
+                result, record = self.scrape(plate)
+            except WebDriverException:
+                self.page_ready = False
+                raise
+        # Only a page that answered can take the next plate in place
+        self.page_ready = result != ERROR
+        return result, record
+
+    def scrape(self, plate):
+        """Scrape the fields of the profile for a given license plate."""
+        driver = self.driver
+        in_place = self.page_ready and self.in_place
+        self.search(plate)
+        sections = get_sections(self.profile)
+
+        try:
+            # Blocks until the page shows the vehicle or the no-data notification
+            try:
+                found = wait_for_result(driver)
+            except TimeoutException:
+                if not in_place:
+                    raise
+                print("No answer to the plate searched in place, reloading...")
+                self.page_ready = False
+                self.search(plate)
+                found = wait_for_result(driver)
+            if not found:
+                raise NoSuchElementException("No vehicle on the page")
+
+            """
+            General data
+            """
+            make_raw = driver.find_element(*VEHICLE_FOUND).text
+            model_raw = driver.find_element(*VEHICLE_TRADE_NAME).text
+
+            """
+            Expand the overview dropdowns the profile needs
+            Vervaldata en historie, Gewichten, Status van het voertuig
+            """
+            overview = [name for name in sections if not SECTIONS[name].get("tab")]
+            for name in overview:
+                self.open_section(SECTIONS[name])
+            # Read every label of the overview in one round trip
+            labels = self.read_labels() if overview else {}
+
+            """
+            Open Engine Data Tab and its dropdowns
+            Motor & Milieu
+            """
+            engine_labels = None
+            if "engine" in sections:
+                try:
+                    self.on_tab = True
+                    self.open_section(SECTIONS["engine"])
+                    engine_labels = self.read_labels()
+                except (NoSuchElementException, TimeoutException):
+                    print("Engine Data Tab not found, skipping engine data...")
+
+        except (NoSuchElementException, TimeoutException):
+            # Check for "no car found" notification
+            try:
+                no_data_notification = driver.find_element(*NO_DATA_NOTIFICATION)
+                if (
+                    "Er zijn geen voertuiggegevens gevonden"
+                    in no_data_notification.text
+                ):
+                    return MISS, None
+            except NoSuchElementException:
+                print(f"Unexpected structure for license plate: {plate}")
+            return ERROR, None
+
+        record = label_record(make_raw, model_raw, labels, engine_labels)
+        return HIT, apply_profile(record, self.profile)
@@ -0,0 +1,43 @@
+"""
+Local stand-in for the RDW open data API, serving plates from a JSON file.
+
+The file maps plates to {dataset: [rows]}, see stub_fixtures.json. Every
+other plate is answered with no rows, like an unknown plate. A dataset
+mapped to a number instead of rows is answered with that HTTP status, to
+try out failing lookups.
+"""
+
+# Python imports
+import json
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), "stub_fixtures.json")
+
+
+def make_stub_server(port=8765, fixtures_path=FIXTURES_PATH, host="127.0.0.1"):
+    """Return an HTTP server answering /<dataset>.json?kenteken=<plate>."""
+    with open(fixtures_path, encoding="utf-8") as file:
+        fixtures = json.load(file)
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            dataset = os.path.basename(url.path).removesuffix(".json")
+            plate = parse_qs(url.query).get("kenteken", [""])[0]
+            rows = fixtures.get(plate, {}).get(dataset, [])
+            status = 200
+            if isinstance(rows, int):
+                status, rows = rows, {"error": True, "code": status}
+            body = json.dumps(rows).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            print(f"Stub server: {format % args}")
+
+    return ThreadingHTTPServer((host, port), StubHandler)
@@ -0,0 +1,171 @@
+"""
+Supervisor of long-running fetch sessions.
+
+A browser session slows down and grows over hours of lookups. The
+supervisor watches the pages it loaded, the refreshes it needed, its memory
+and its recent lookup latency, restarts it before it degrades and writes
+those metrics to a JSON file per session for monitoring.
+"""
+
+# Python imports
+import itertools
+import json
+import os
+import socket
+import statistics
+from collections import deque
+from datetime import datetime
+import time as t
+
+# Django Imports
+from django.conf import settings
+
+from core.fetch.base import FetchBackend
+from core.utilities.scan_result import ERROR
+
+# Numbers the sessions of this process
+session_numbers = itertools.count(1)
+
+
+class SupervisedBackend(FetchBackend):
+    """
+    Wrap a fetch backend and recycle (close and reopen) it when it degrades.
+
+    A session is recycled when it loaded SESSION_MAX_PAGES pages, needed
+    SESSION_MAX_REFRESHES refreshes, its JavaScript heap grew past
+    SESSION_MAX_HEAP_MB or the median of its recent lookups got
+    SESSION_LATENCY_FACTOR times slower than right after it started.
+    A session that fails to restart is opened again before the next lookup.
+    """
+
+    def __init__(self, backend, window=20):
+        self.backend = backend
+        self.name = backend.name
+        self.session = f"{socket.gethostname()}-{os.getpid()}-{next(session_numbers)}"
+        self.window = window
+        self.recycles = 0
+        self.last_recycle_reason = None
+        self.needs_open = False
+        self.reset()
+
+    def reset(self):
+        self.started = datetime.now()
+        self.lookups = 0
+        self.baseline = []
+        self.recent = deque(maxlen=self.window)
+        self.metrics = {}
+
+    @property
+    def metrics_path(self):
+        return os.path.join(settings.SESSION_METRICS_DIR, f"{self.session}.json")
+
+    def open(self):
+        self.backend.open()
+        self.reset()
+        self.export()
+
+    def close(self):
+        self.backend.close()
+        if os.path.exists(self.metrics_path):
+            os.remove(self.metrics_path)
+
+    def fetch(self, plate):
+        if self.needs_open:
+            try:
+                self.open()
+            except Exception as e:
+                print(f"Reopening session {self.session} failed: {e}")
+                return ERROR, None
+            self.needs_open = False
+        start_time = t.perf_counter()
+        result, record = self.backend.fetch(plate)
+        latency = t.perf_counter() - start_time
+
+        self.lookups += 1
+        if len(self.baseline) < self.window:
+            self.baseline.append(latency)
+        self.recent.append(latency)
+        self.metrics = self.backend.session_metrics()
+        self.export()
+
+        reason = self.recycle_reason()
+        if reason:
+            self.recycle(reason)
+        return result, record
+
+    def recent_latency(self):
+        """Median latency of the recent and of the first lookups, None if too few."""
+        if len(self.baseline) < self.window or len(self.recent) < self.window:
+            return None, None
+        return statistics.median(self.recent), statistics.median(self.baseline)
+
+    def recycle_reason(self):
+        """Why the session should be recycled, None while it is healthy."""
+        metrics = self.metrics
+        if metrics.get("pages", 0) >= settings.SESSION_MAX_PAGES:
+            return f"{metrics['pages']} pages loaded"
+        if metrics.get("refreshes", 0) >= settings.SESSION_MAX_REFRESHES:
+            return f"{metrics['refreshes']} refreshes needed"
+        if metrics.get("heap_mb", 0) >= settings.SESSION_MAX_HEAP_MB:
+            return f"heap at {metrics['heap_mb']} MB"
+        recent, baseline = self.recent_latency()
+        if recent and recent >= baseline * settings.SESSION_LATENCY_FACTOR:
+            return f"lookups slowed from {baseline:.2f}s to {recent:.2f}s"
+        return None
+
+    def recycle(self, reason):
+        """Restart the session, the lookup that triggered it is kept either way."""
+        print(f"Recycling session {self.session}: {reason}")
+        self.recycles += 1
+        self.last_recycle_reason = reason
+        try:
+            self.backend.close()
+        except Exception as e:
+            print(f"Closing session {self.session} failed: {e}")
+        try:
+            self.backend.open()
+            self.reset()
+            self.export()
+        except Exception as e:
+            print(f"Restarting session {self.session} failed, retrying later: {e}")
+            self.needs_open = True
+
+    def export(self):
+        """Write the metrics of the session to its JSON file."""
+        recent, baseline = self.recent_latency()
+        data = {
+            "session": self.session,
+            "backend": self.name,
+            "started": self.started.isoformat(),
+            "updated": datetime.now().isoformat(),
+            "lookups": self.lookups,
+            **self.metrics,
+            "recent_latency": recent,
+            "baseline_latency": baseline,
+            "recycles": self.recycles,
+            "last_recycle_reason": self.last_recycle_reason,
+        }
+        os.makedirs(settings.SESSION_METRICS_DIR, exist_ok=True)
+        temporary_path = f"{self.metrics_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        # Readers never see a half written file
+        os.replace(temporary_path, self.metrics_path)
+
+
+def get_session_metrics():
+    """Return the exported metrics of every open session, oldest first."""
+    directory = settings.SESSION_METRICS_DIR
+    if not os.path.isdir(directory):
+        return []
+    sessions = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as file:
+                sessions.append(json.load(file))
+        except (OSError, ValueError):
+            # Closed while it was being read
+            continue
+    return sorted(sessions, key=lambda session: session["started"])
@@ -0,0 +1,108 @@
+"""
+Waits of the selenium backends: block until the page reached a state
+instead of sleeping a fixed time, and time every step.
+"""
+
+# Selenium Imports
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from core.utilities.step_latency import timed_step
+
+# Seconds every step may take before the wait gives up
+STEP_TIMEOUTS = {
+    "search_field": 10,
+    "result": 15,
+    "accordion": 5,
+}
+
+# Elements the OVI page shows once a search is answered. Results of an
+# earlier search on the same page are marked stale and do not count.
+STALE_MARK = "data-scraper-stale"
+VEHICLE_FOUND = (By.CSS_SELECTOR, f".vehicle-brand:not([{STALE_MARK}])")
+VEHICLE_TRADE_NAME = (By.CSS_SELECTOR, f".vehicle-trade-name:not([{STALE_MARK}])")
+NO_DATA_NOTIFICATION = (By.CSS_SELECTOR, f".notification-content:not([{STALE_MARK}])")
+
+MARK_STALE_SCRIPT = f"""
+for (const element of document.querySelectorAll(
+    ".vehicle-brand, .vehicle-trade-name, .notification-content"
+)) {{
+    element.setAttribute("{STALE_MARK}", "");
+}}
+"""
+
+
+def wait_for(driver, step, condition):
+    """
+    Wait until a condition holds and record the wait as the step.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        step (str): Step name, a key of STEP_TIMEOUTS.
+        condition: Callable taking the driver, like the expected_conditions.
+
+    Returns:
+        The truthy value the condition returned.
+
+    Raises:
+        TimeoutException: If the condition does not hold within the timeout.
+    """
+    with timed_step(step):
+        return WebDriverWait(driver, STEP_TIMEOUTS[step], poll_frequency=0.1).until(
+            condition
+        )
+
+
+def wait_for_search_field(driver):
+    """Wait until the licence plate field is on the page."""
+    return wait_for(
+        driver, "search_field", EC.element_to_be_clickable((By.ID, "kenteken"))
+    )
+
+
+def wait_for_result(driver):
+    """
+    Wait until a search is answered.
+
+    Returns:
+        bool: True if the page shows a vehicle, False if it shows the
+        no-data notification.
+
+    Raises:
+        TimeoutException: If neither shows up in time.
+    """
+    element = wait_for(
+        driver,
+        "result",
+        EC.any_of(
+            EC.visibility_of_element_located(VEHICLE_FOUND),
+            EC.visibility_of_element_located(NO_DATA_NOTIFICATION),
+        ),
+    )
+    return "vehicle-brand" in (element.get_attribute("class") or "")
+
+
+def mark_results_stale(driver):
+    """Mark the result of the last search so waits only see the next one."""
+    driver.execute_script(MARK_STALE_SCRIPT)
+
+
+def aria_state(toggle):
+    """Whether an accordion toggle or tab is open, None if it does not tell."""
+    expanded = toggle.get_attribute("aria-expanded")
+    selected = toggle.get_attribute("aria-selected")
+    if expanded is None and selected is None:
+        return None
+    return "true" in (expanded, selected)
+
+
+def is_expanded(toggle):
+    """Whether an accordion toggle or tab reports itself as open."""
+    # A toggle that does not tell is open once it has been clicked
+    return aria_state(toggle) is not False
+
+
+def wait_for_expanded(driver, toggle):
+    """Wait until a clicked accordion or tab is open."""
+    return wait_for(driver, "accordion", lambda driver: is_expanded(toggle))
@@ -0,0 +1,78 @@
+# Python imports
+import time as t
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.patterns.plate_code import encode_plate
+from core.patterns.sidecodes import classify_many
+
+# Custom models imports
+from vehicles.models import Vehicle
+
+
+class Command(BaseCommand):
+    help = "Fill Vehicle.plate_code and Vehicle.sidecode for vehicles saved before the columns existed"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of vehicles read and updated per query",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Refill every vehicle, not only those without a plate_code (e.g. after the sidecodes changed)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        start_time = t.time()
+        updated = 0
+        skipped = 0
+        last_id = 0
+
+        # Vehicle.save fills both columns, so a vehicle with a plate_code is
+        # done, whether its plate has a sidecode or not
+        vehicles_to_fill = Vehicle.objects.all()
+        if not options["all"]:
+            vehicles_to_fill = vehicles_to_fill.filter(plate_code__isnull=True)
+
+        # Walk the table in id order so memory stays flat and every row is read once
+        while True:
+            batch = list(
+                vehicles_to_fill.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "licence_plate")[:batch_size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+
+            # Both columns in one pass, the sidecodes of the whole batch at once
+            vehicle_ids, plates = zip(*batch)
+            vehicles = []
+            for vehicle_id, plate, sidecode in zip(
+                vehicle_ids, plates, classify_many(plates)
+            ):
+                code = encode_plate(plate)
+                if code is None:
+                    skipped += 1
+                    continue
+                vehicles.append(
+                    Vehicle(id=vehicle_id, plate_code=code, sidecode=sidecode)
+                )
+            # bulk_update skips Vehicle.save, only the plate columns are written
+            Vehicle.objects.bulk_update(vehicles, ["plate_code", "sidecode"])
+            updated += len(vehicles)
+            print(f"Updated {updated} vehicles (last id {last_id})")
+
+        print(
+            f"{Fore.GREEN}Done: {updated} vehicles filled, {skipped} plates without a code in {t.time() - start_time:.2f} seconds.{Style.RESET_ALL}"
+        )
@@ -0,0 +1,84 @@
+# Python imports
+import statistics
+import time as t
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.fetch.browser_profiles import BROWSER_PROFILES
+from core.fetch.selenium_backend import OVI_URL, SeleniumBackend
+from core.fetch.waits import wait_for_search_field
+
+# Bytes and requests of the last page load, from the Resource Timing API
+PAGE_WEIGHT_SCRIPT = """
+const entries = performance.getEntriesByType("resource");
+const navigation = performance.getEntriesByType("navigation")[0];
+let bytes = navigation ? navigation.transferSize : 0;
+for (const entry of entries) {
+    bytes += entry.transferSize;
+}
+return [entries.length, bytes];
+"""
+
+
+class Command(BaseCommand):
+    help = "Benchmark OVI page-load time per Chrome browser profile"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "--loads",
+            type=int,
+            default=10,
+            help="Number of page loads per browser profile",
+        )
+        parser.add_argument(
+            "--profiles",
+            nargs="+",
+            choices=BROWSER_PROFILES,
+            default=list(BROWSER_PROFILES),
+            help="Browser profiles to compare",
+        )
+        parser.add_argument(
+            "--headless",
+            action="store_true",
+            help="Run the default profile headless too, to compare like for like",
+        )
+
+    def measure(self, browser_profile, loads, headless):
+        """Load the OVI page `loads` times, returns the load times and page weight."""
+        backend = SeleniumBackend(headless=headless, browser_profile=browser_profile)
+        backend.open()
+        try:
+            timings = []
+            for _ in range(loads):
+                start_time = t.perf_counter()
+                backend.driver.get(OVI_URL)
+                wait_for_search_field(backend.driver)
+                timings.append(t.perf_counter() - start_time)
+            requests, transferred = backend.driver.execute_script(PAGE_WEIGHT_SCRIPT)
+        finally:
+            backend.close()
+        return timings, requests, transferred
+
+    def handle(self, *args, **options):
+        loads = options["loads"]
+        print(f"Benchmarking {loads} OVI page loads per browser profile")
+
+        results = {}
+        for browser_profile in options["profiles"]:
+            timings, requests, transferred = self.measure(
+                browser_profile, loads, options["headless"]
+            )
+            results[browser_profile] = statistics.median(timings)
+            print(
+                f"{browser_profile:<10} median {statistics.median(timings):>6.2f}s  "
+                f"mean {statistics.mean(timings):>6.2f}s  slowest {max(timings):>6.2f}s  "
+                f"{Fore.GREEN}{requests:>4} requests {transferred / 1024:>8.1f} KB{Style.RESET_ALL}"
+            )
+
+        if "default" in results and "lean" in results and results["lean"]:
+            print(f"Lean profile speedup: {results['default'] / results['lean']:.1f}x")
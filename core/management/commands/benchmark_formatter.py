@@ -0,0 +1,94 @@
+# Python imports
+import random
+import re
+import time as t
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.patterns.sidecodes import sidecodes
+from core.utilities.licence_plate_formatter import format_license_plate, format_many
+
+# The regex rules the precompiled formatter replaced
+regex_format_rules = {
+    r"([A-Z]{2})(\d{2})(\d{2})": r"\1-\2-\3",
+    r"(\d{2})([A-Z]{2})(\d{2})": r"\1-\2-\3",
+    r"(\d{2})([A-Z]{2})([A-Z]{2})": r"\1-\2-\3",
+    r"(\d{2})(\d{2})([A-Z]{2})": r"\1-\2-\3",
+    r"([A-Z]{2})(\d{2})([A-Z]{2})": r"\1-\2-\3",
+    r"(\d{2})([A-Z]{3})(\d{1})": r"\1-\2-\3",
+    r"(\d{1})([A-Z]{3})(\d{2})": r"\1-\2-\3",
+    r"([A-Z]{3})(\d{2})([A-Z]{1})": r"\1-\2-\3",
+    r"([A-Z]{1})(\d{3})([A-Z]{2})": r"\1-\2-\3",
+}
+
+
+def regex_format_license_plate(plate):
+    """The regex loop format_license_plate used before it was precompiled."""
+    for pattern, replacement in regex_format_rules.items():
+        if re.fullmatch(pattern, plate):
+            return re.sub(pattern, replacement, plate)
+    return plate
+
+
+class Command(BaseCommand):
+    help = "Benchmark plates/second of the licence plate formatter"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=200_000,
+            help="Number of plates to format per run",
+        )
+
+    def measure(self, label, run, plates):
+        """Format all plates with `run` and print the throughput."""
+        start_time = t.perf_counter()
+        formatted = run(plates)
+        elapsed_time = t.perf_counter() - start_time
+        rate = len(plates) / elapsed_time if elapsed_time else 0
+        print(
+            f"{label:<28} {len(plates):>10} plates {elapsed_time:>8.3f}s {Fore.GREEN}{rate:>14,.0f} plates/s{Style.RESET_ALL}"
+        )
+        return rate, formatted
+
+    def handle(self, *args, **options):
+        count = options["count"]
+
+        # Random plates spread over every sidecode
+        random.seed(0)
+        sources = list(sidecodes.values())
+        plates = []
+        for _ in range(count):
+            sidecode = random.choice(sources)
+            plates.append(sidecode.unrank(random.randrange(sidecode.size())))
+        print(f"Benchmarking formatter on {count} plates")
+
+        baseline, expected = self.measure(
+            "regex loop",
+            lambda plates: [regex_format_license_plate(plate) for plate in plates],
+            plates,
+        )
+        format_license_plate.cache_clear()
+        cold, cold_formatted = self.measure(
+            "format_license_plate (cold)",
+            lambda plates: [format_license_plate(plate) for plate in plates],
+            plates,
+        )
+        warm, warm_formatted = self.measure(
+            "format_license_plate (warm)",
+            lambda plates: [format_license_plate(plate) for plate in plates],
+            plates,
+        )
+        batch, batch_formatted = self.measure("format_many", format_many, plates)
+
+        if not expected == cold_formatted == warm_formatted == batch_formatted:
+            print(f"{Fore.RED}Formatters disagree!{Style.RESET_ALL}")
+        print(f"Cold cache speedup: {cold / baseline:.1f}x")
+        print(f"Warm cache speedup: {warm / baseline:.1f}x")
+        print(f"format_many speedup: {batch / baseline:.1f}x")
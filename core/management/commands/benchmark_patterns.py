@@ -0,0 +1,89 @@
+# Python imports
+import time as t
+from itertools import islice
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Terminal color import
+from colorama import Fore, Style
+
+# Compiled 99-XXX-9 sidecode
+from core.patterns.sidecodes import sidecodes
+
+
+def nested_loop_99_xxx_9():
+    """The hand-written 99XXX9 generator the sidecode compiler replaced."""
+    excluded_letters = {"A", "C", "E", "I", "M", "O", "Q", "U", "W", "Y"}
+    excluded_patterns = {"SS", "SD"}
+
+    for digit1 in range(10):
+        for digit2 in range(10):
+            for letter1 in range(ord("A"), ord("Z") + 1):
+                for letter2 in range(ord("A"), ord("Z") + 1):
+                    for letter3 in range(ord("A"), ord("Z") + 1):
+                        for digit3 in range(10):
+                            char1, char2, char3 = (
+                                chr(letter1),
+                                chr(letter2),
+                                chr(letter3),
+                            )
+                            if (
+                                char1 in excluded_letters
+                                or char2 in excluded_letters
+                                or char3 in excluded_letters
+                            ):
+                                continue
+                            if (
+                                f"{char1}{char2}" in excluded_patterns
+                                or f"{char2}{char3}" in excluded_patterns
+                            ):
+                                continue
+                            yield f"{digit1}{digit2}{char1}{char2}{char3}{digit3}"
+
+
+class Command(BaseCommand):
+    help = "Benchmark plates/second of the compiled sidecodes against nested loops"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=1_000_000,
+            help="Number of plates to generate per run",
+        )
+
+    def measure(self, label, plates, count):
+        """Consume `count` plates and print the throughput."""
+        start_time = t.perf_counter()
+        generated = sum(1 for _ in islice(plates, count))
+        elapsed_time = t.perf_counter() - start_time
+        rate = generated / elapsed_time if elapsed_time else 0
+        print(
+            f"{label:<28} {generated:>10} plates {elapsed_time:>8.3f}s {Fore.GREEN}{rate:>14,.0f} plates/s{Style.RESET_ALL}"
+        )
+        return rate
+
+    def measure_blocks(self, label, sidecode, count):
+        """Generate `count` plates as NumPy blocks and print the throughput."""
+        start_time = t.perf_counter()
+        generated = sum(len(block) for block in sidecode.blocks(0, count))
+        elapsed_time = t.perf_counter() - start_time
+        rate = generated / elapsed_time if elapsed_time else 0
+        print(
+            f"{label:<28} {generated:>10} plates {elapsed_time:>8.3f}s {Fore.GREEN}{rate:>14,.0f} plates/s{Style.RESET_ALL}"
+        )
+        return rate
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        sidecode = sidecodes["99XXX9"]
+        print(f"Benchmarking pattern {sidecode.spec} ({sidecode.size()} plates)")
+
+        baseline = self.measure("nested loops", nested_loop_99_xxx_9(), count)
+        iterated = self.measure("compiled iter_from", sidecode.iter_from(0), count)
+        vectorized = self.measure_blocks("compiled blocks (NumPy)", sidecode, count)
+
+        print(f"iter_from speedup: {iterated / baseline:.1f}x")
+        print(f"blocks speedup: {vectorized / baseline:.1f}x")
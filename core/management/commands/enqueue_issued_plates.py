@@ -0,0 +1,64 @@
+# Python imports
+from itertools import islice
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Terminal color import
+from colorama import Fore, Style
+
+# Custom models imports
+from core.models import UncheckedPlates
+from core.patterns.frontier import get_issued_delta
+from core.patterns.issued import HIGH_PRIORITY
+
+
+class Command(BaseCommand):
+    help = "Queue the plates issued since the previous LastPlateIssued snapshot"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=100000,
+            help="Most plates to queue, guards against a wrong snapshot",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of plates looked up and inserted per query",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        plates = islice(get_issued_delta(), options["limit"])
+        created = 0
+        raised = 0
+
+        while True:
+            batch = list(islice(plates, batch_size))
+            if not batch:
+                break
+            # Plates already queued at a lower priority move to the ISSUED
+            # source. Its keyset cursor is past their old ids, so they are
+            # deleted and inserted again with fresh ones
+            queued = UncheckedPlates.objects.filter(plate__in=batch)
+            lower = queued.filter(priority__lt=HIGH_PRIORITY)
+            raised_plates = set(lower.values_list("plate", flat=True))
+            lower.delete()
+            existing = set(queued.values_list("plate", flat=True))
+            UncheckedPlates.objects.bulk_create(
+                [
+                    UncheckedPlates(plate=plate, priority=HIGH_PRIORITY)
+                    for plate in batch
+                    if plate not in existing
+                ]
+            )
+            raised += len(raised_plates - existing)
+            created += len(set(batch) - existing - raised_plates)
+
+        print(
+            f"{Fore.GREEN}Queued {created} newly issued plates, raised the priority of {raised}.{Style.RESET_ALL}"
+        )
@@ -0,0 +1,76 @@
+# Python imports
+import numpy as np
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.patterns.exclusion_rules import compile_pattern
+from core.patterns.sidecodes import RULES_VERSION, exclusion_rules, sidecodes
+from core.utilities.scan_state import UNCHECKED, get_state_map
+
+
+def checked_ranges(pattern):
+    """
+    Return the ranges of checked plates of a sidecode as (start, stop) pairs.
+
+    The ranges come from the scan state, so they hold what was really
+    looked up whatever the order of the cursors that scanned them.
+    """
+    states = get_state_map(pattern).read()
+    edges = np.diff(np.concatenate(([0], states != UNCHECKED, [0])).astype(np.int8))
+    return list(zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+
+def relaxed_size(sidecode, relaxed, ranges):
+    """
+    Return the number of plates the relaxed sidecode has in the ranges.
+
+    A rule only removes plates, so the plates of the sidecode are in the
+    same order in the relaxed sidecode and a range maps onto the range
+    between its first and last plate there.
+    """
+    return sum(
+        relaxed.rank(sidecode.unrank(int(stop) - 1))
+        - relaxed.rank(sidecode.unrank(int(start)))
+        + 1
+        for start, stop in ranges
+    )
+
+
+class Command(BaseCommand):
+    help = "Report how many lookups every exclusion rule saved per sidecode"
+
+    def handle(self, *args, **options):
+        print(f"Exclusion rules version {RULES_VERSION}")
+        totals = {rule_id: 0 for rule_id in exclusion_rules["rules"]}
+
+        for pattern, sidecode in sidecodes.items():
+            rule_ids = exclusion_rules["sidecodes"][pattern]["rules"]
+            if not rule_ids:
+                continue
+            ranges = checked_ranges(pattern)
+            if not ranges:
+                continue
+
+            # Plates in the checked ranges, with and without each rule
+            checked = int(sum(stop - start for start, stop in ranges))
+            print(
+                f"{Fore.YELLOW}{pattern}{Style.RESET_ALL}: {checked} lookups in {len(ranges)} checked ranges"
+            )
+            for rule_id in rule_ids:
+                relaxed = compile_pattern(exclusion_rules, pattern, skip_rule=rule_id)
+                saved = relaxed_size(sidecode, relaxed, ranges) - checked
+                totals[rule_id] += saved
+                print(
+                    f"  {rule_id:<16} {Fore.GREEN}{saved:>12} lookups saved{Style.RESET_ALL}"
+                )
+
+        print("Total per rule:")
+        for rule_id, saved in totals.items():
+            description = exclusion_rules["rules"][rule_id].get("description", "")
+            print(
+                f"  {rule_id:<16} {Fore.GREEN}{saved:>12}{Style.RESET_ALL}  {description}"
+            )
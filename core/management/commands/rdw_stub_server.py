@@ -0,0 +1,38 @@
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.fetch.stub_server import FIXTURES_PATH, make_stub_server
+
+
+class Command(BaseCommand):
+    help = "Serve a local stand-in of the RDW open data API for the http backend"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=8765,
+            help="Port to listen on",
+        )
+        parser.add_argument(
+            "--fixtures",
+            type=str,
+            default=FIXTURES_PATH,
+            help="JSON file with the rows served per plate and dataset",
+        )
+
+    def handle(self, *args, **options):
+        server = make_stub_server(options["port"], options["fixtures"])
+        print(
+            f"{Fore.GREEN}Stand-in server on http://127.0.0.1:{options['port']}, set RDW_OPEN_DATA_URL to use it{Style.RESET_ALL}"
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,92 @@
+# Python imports
+import json
+import time as t
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Selenium Imports
+from selenium.common.exceptions import WebDriverException
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.fetch.network_backend import OVI_API_PATH, RECORDING_PATH, NetworkBackend
+
+
+class Command(BaseCommand):
+    help = "Record the network log of one OVI lookup, for the network backend tests"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "plate",
+            type=str,
+            help="License plate to look up, without dashes",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default=RECORDING_PATH,
+            help="JSON file to write the recording to",
+        )
+        parser.add_argument(
+            "--wait",
+            type=float,
+            default=10,
+            help="Seconds to let the lookup load before reading the log",
+        )
+        parser.add_argument(
+            "--headless",
+            action="store_true",
+            help="Run the browser headless",
+        )
+
+    def handle(self, *args, **options):
+        plate = options["plate"].upper().replace("-", "")
+        backend = NetworkBackend(headless=options["headless"])
+        backend.open()
+        try:
+            # Drop the log entries of the page load
+            backend.driver.get_log("performance")
+            backend.search(plate)
+            t.sleep(options["wait"])
+            log = backend.driver.get_log("performance")
+
+            # Bodies of every finished OVI API response, whatever its URL,
+            # so the recording shows what the page really requests
+            api_requests = set()
+            bodies = {}
+            for entry in log:
+                message = json.loads(entry["message"])["message"]
+                params = message["params"]
+                if message["method"] == "Network.responseReceived":
+                    if OVI_API_PATH in params["response"]["url"]:
+                        api_requests.add(params["requestId"])
+                elif message["method"] == "Network.loadingFinished":
+                    if params["requestId"] not in api_requests:
+                        continue
+                    try:
+                        bodies[params["requestId"]] = backend.driver.execute_cdp_cmd(
+                            "Network.getResponseBody",
+                            {"requestId": params["requestId"]},
+                        )["body"]
+                    except WebDriverException:
+                        pass
+        finally:
+            backend.close()
+
+        with open(options["output"], "w") as f:
+            json.dump(
+                {
+                    "source": f"Recorded from ovi.rdw.nl, lookup of {plate}",
+                    "plate": plate,
+                    "log": log,
+                    "bodies": bodies,
+                },
+                f,
+                indent=4,
+            )
+        print(
+            f"{Fore.GREEN}Recorded {len(log)} log entries and {len(bodies)} API bodies to {options['output']}{Style.RESET_ALL}"
+        )
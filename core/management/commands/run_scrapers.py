@@ -0,0 +1,235 @@
+# Python imports
+import signal
+import subprocess
+import sys
+import time as t
+from datetime import datetime
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Terminal color import
+from colorama import Fore, Style, init
+
+# Plate sources
+from core.patterns.registry import pattern_to_source
+from core.patterns.ordering import ORDERS
+from core.utilities.plate_cursor import get_scan_source, get_shard_range, is_shard_done
+
+init(autoreset=True)
+
+
+class Command(BaseCommand):
+    help = "Sweep one pattern with N get_vehicles --daemon workers, one shard each"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "--pattern",
+            type=str,
+            required=True,
+            help="Pattern to check for license plates",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=2,
+            help="Number of shard workers to run in parallel",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5,
+            help="Number of license plates every worker run processes",
+        )
+        parser.add_argument(
+            "--order",
+            type=str,
+            choices=ORDERS,
+            default="ascending",
+            help="Scan order passed on to the workers",
+        )
+        parser.add_argument(
+            "--bound-margin",
+            type=int,
+            default=10000,
+            help="Plates to check past the highest hit of a series no longer issued",
+        )
+        parser.add_argument(
+            "--issued",
+            action="store_true",
+            help="Also keep a get_vehicles --pattern ISSUED daemon running for "
+            "the plates enqueue_issued_plates queues every night",
+        )
+        parser.add_argument(
+            "--restart-delay",
+            type=int,
+            default=5,
+            help="Seconds to wait before restarting a worker that failed",
+        )
+
+    def start_worker(
+        self, pattern, shard, chunk_size, order, bound_margin, daemon=False
+    ):
+        """Start a get_vehicles process for one shard."""
+        command = [
+            sys.executable,
+            str(settings.BASE_DIR / "manage.py"),
+            "get_vehicles",
+            "--pattern",
+            pattern,
+            "--shard",
+            shard,
+            "--chunk-size",
+            str(chunk_size),
+            "--order",
+            order,
+            "--bound-margin",
+            str(bound_margin),
+        ]
+        if daemon:
+            command.append("--daemon")
+        return subprocess.Popen(command)
+
+    def stop(self, signum, frame):
+        """Stop restarting workers and terminate the running ones."""
+        print(Fore.YELLOW + "Stopping workers..." + Style.RESET_ALL)
+        self.running = False
+
+    def handle(self, *args, **options):
+        pattern = options["pattern"]
+        workers = options["workers"]
+        chunk_size = options["chunk_size"]
+        order = options["order"]
+        bound_margin = options["bound_margin"]
+        restart_delay = options["restart_delay"]
+
+        if pattern not in pattern_to_source:
+            raise CommandError(f"Unknown pattern '{pattern}'.")
+        if workers < 1:
+            raise CommandError("--workers must be at least 1.")
+
+        source = pattern_to_source[pattern]
+        size = source.size()
+        shards = {}
+        for index in range(workers):
+            shard = f"{index}/{workers}"
+            shards[shard] = {
+                "process": None,
+                "restarts": 0,
+                "next_start": 0,
+                "stopping": False,
+                "finished": False,
+            }
+
+        # The ISSUED worker never finishes, it waits for the next night's plates
+        issued = None
+        if options["issued"]:
+            issued = {"process": None, "restarts": 0, "next_start": 0}
+
+        print(Fore.GREEN + "Command executed!" + Style.RESET_ALL)
+        print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Pattern {pattern}: {size} plates over {workers} shards")
+
+        self.running = True
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+
+        shards_done = False
+        try:
+            while self.running:
+                active = 0
+                for shard, state in shards.items():
+                    if state["finished"]:
+                        continue
+                    # The issued range and anchor can move, look them up again
+                    scan_source, scan_order, anchor = get_scan_source(
+                        source, pattern, order, bound_margin, verbose=False
+                    )
+                    # Shard ranges are frozen when first assigned, like in get_vehicles
+                    start, stop = get_shard_range(
+                        scan_source, pattern, shard, scan_order
+                    )
+                    done = is_shard_done(
+                        scan_source, pattern, shard, start, stop, scan_order
+                    )
+
+                    process = state["process"]
+                    if process is not None:
+                        return_code = process.poll()
+                        if return_code is None:
+                            if done and not state["stopping"]:
+                                # Daemon workers wait at the end of their shard
+                                process.terminate()
+                                state["stopping"] = True
+                            active += 1
+                            continue
+                        state["process"] = None
+                        state["stopping"] = False
+                        if return_code == 0:
+                            # Daemon workers only exit cleanly once stopped
+                            print(Fore.GREEN + f"Worker {shard} finished.")
+                            state["finished"] = True
+                            continue
+                        state["restarts"] += 1
+                        state["next_start"] = t.time() + restart_delay
+                        print(
+                            f"{Fore.RED}Worker {shard} exited with code {return_code}, restart {state['restarts']} in {restart_delay}s{Style.RESET_ALL}"
+                        )
+
+                    if done:
+                        continue
+                    active += 1
+                    if t.time() >= state["next_start"]:
+                        state["process"] = self.start_worker(
+                            pattern, shard, chunk_size, order, bound_margin, daemon=True
+                        )
+
+                if issued is not None:
+                    process = issued["process"]
+                    return_code = None if process is None else process.poll()
+                    if return_code is not None:
+                        issued["process"] = None
+                        issued["restarts"] += 1
+                        issued["next_start"] = t.time() + restart_delay
+                        print(
+                            f"{Fore.RED}Worker ISSUED exited with code {return_code}, restart {issued['restarts']} in {restart_delay}s{Style.RESET_ALL}"
+                        )
+                    if issued["process"] is None and t.time() >= issued["next_start"]:
+                        issued["process"] = self.start_worker(
+                            "ISSUED",
+                            "",
+                            chunk_size,
+                            "ascending",
+                            bound_margin,
+                            daemon=True,
+                        )
+
+                if not active:
+                    if issued is None:
+                        print(Fore.GREEN + f"All shards of {pattern} are done.")
+                        break
+                    if not shards_done:
+                        print(
+                            Fore.GREEN
+                            + f"All shards of {pattern} are done, the ISSUED worker keeps running."
+                        )
+                        shards_done = True
+                t.sleep(1)
+        finally:
+            states = list(shards.values())
+            if issued is not None:
+                states.append(issued)
+            for state in states:
+                process = state["process"]
+                if process is not None and process.poll() is None:
+                    process.terminate()
+            for state in states:
+                process = state["process"]
+                if process is not None:
+                    try:
+                        process.wait(timeout=60)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+            print(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -0,0 +1,61 @@
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Terminal color import
+from colorama import Fore, Style
+
+from core.patterns.registry import has_plate_count, pattern_to_source
+from core.utilities.scan_counters import get_scan_coverage
+
+
+class Command(BaseCommand):
+    help = "Report scan coverage, hit rates and the projected completion per pattern"
+
+    def add_arguments(self, parser):
+        """Add custom arguments to the command."""
+        parser.add_argument(
+            "--pattern",
+            type=str,
+            default=None,
+            help="Only report this pattern",
+        )
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=24,
+            help="Number of recent hours the scan rate is measured over",
+        )
+
+    def handle(self, *args, **options):
+        pattern = options["pattern"]
+        if pattern is not None and pattern not in pattern_to_source:
+            raise CommandError(f"Unknown pattern '{pattern}'.")
+        # Database sources are queues keyed by primary key, they have no size
+        # to measure coverage against
+        patterns = [
+            name
+            for name in ([pattern] if pattern else pattern_to_source)
+            if has_plate_count(pattern_to_source[name])
+        ]
+        if not patterns:
+            raise CommandError(f"Pattern '{pattern}' has no coverage to report.")
+
+        print(
+            f"{'Pattern':<8} {'Size':>10} {'In range':>10} {'Checked':>10} {'Hits':>8} {'Misses':>8} {'Errors':>7} {'Plates/h':>9}  ETA"
+        )
+        for name in patterns:
+            coverage = get_scan_coverage(
+                name, pattern_to_source[name], options["hours"]
+            )
+            eta = coverage["eta"]
+            print(
+                f"{name:<8} {coverage['size']:>10} {coverage['scan_size']:>10} {coverage['checked']:>10} "
+                f"{Fore.GREEN}{coverage['hits']:>8}{Style.RESET_ALL} {coverage['misses']:>8} "
+                f"{Fore.RED}{coverage['errors']:>7}{Style.RESET_ALL} {coverage['plates_per_hour']:>9}  "
+                f"{eta.strftime('%Y-%m-%d %H:%M') if eta else '-'}"
+            )
+            for cursor in coverage["cursors"]:
+                print(
+                    f"{'':<8} cursor {cursor['shard'] or 'all'} ({cursor['order']}): "
+                    f"offset {'-' if cursor['offset'] is None else cursor['offset']}, plate {cursor['plate']}"
+                )
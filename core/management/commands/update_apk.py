@@ -6,16 +6,12 @@ from datetime import datetime, date
 import itertools
 
 # Django Imports
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils.timezone import now
 from django.shortcuts import get_object_or_404
 from django.http import Http404
 
-# Selenium Imports
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-
 # Terminal color import
 from colorama import Fore, Back, Style, init
 
@@ -23,14 +19,19 @@ from colorama import Fore, Back, Style, init
 Pattern and Utility Imports
 """
 # APK pattern
-from core.patterns.pattern_apk import generate_license_plates_from_db_for_APK_check
-
+from core.patterns import pattern_apk
+from core.fetch.backends import BACKENDS, get_backend
+from core.fetch.browser_profiles import BROWSER_PROFILES
+from core.fetch.pool import BackendPool, CompletedPrefix
+from core.fetch.supervisor import SupervisedBackend
 
 # Data Clearning and Utilities Imports
 from core.utilities.random_pause import random_pause
 from core.utilities.licence_plate_formatter import format_license_plate as formatted
-from core.utilities.get_table_element import get_element_text_by_label as get_text
-from core.utilities.get_date import get_date as get_date
+from core.utilities.scan_result import MISS, ERROR
+from core.utilities.step_latency import print_step_latencies
+from core.utilities.worker_control import GracefulStop, Heartbeat
+from core.utilities.plate_cursor import get_resume_index, save_last_plate
 
 # Custom models imports
 from vehicles.models import (
@@ -42,10 +43,19 @@ from core.models import (
     RecheckForAPKPlates,
 )
 
-
 locale.setlocale(locale.LC_TIME, "Dutch_Netherlands.1252")
 init(autoreset=True)
 
+# Record fields of the "apk" profile stored on the Vehicle
+APK_FIELDS = (
+    "first_reg",
+    "first_reg_in_NL",
+    "imported_in_NL",
+    "apk",
+    "exported",
+    "insurance",
+)
+
 
 class Command(BaseCommand):
     help = "Scrape car data from RDW and save to database"
@@ -64,6 +74,48 @@ class Command(BaseCommand):
             default=None,
             help="Pattern to check for license plates",
         )
+        parser.add_argument(
+            "--backend",
+            type=str,
+            choices=BACKENDS,
+            default=settings.FETCH_BACKEND,
+            help="How plates are looked up, see get_vehicles --backend",
+        )
+        parser.add_argument(
+            "--no-fallback",
+            action="store_true",
+            help="Do not retry failed network or http lookups by scraping the page",
+        )
+        parser.add_argument(
+            "--browsers",
+            type=int,
+            default=1,
+            help="Number of backends (browser sessions) looking plates up in parallel",
+        )
+        parser.add_argument(
+            "--headless",
+            action="store_true",
+            help="Run the browsers without a window",
+        )
+        parser.add_argument(
+            "--daemon",
+            action="store_true",
+            help="Keep processing chunks until stopped (SIGTERM) instead of one chunk",
+        )
+        parser.add_argument(
+            "--idle-sleep",
+            type=int,
+            default=300,
+            help="Seconds a daemon waits before looking for new plates once done",
+        )
+        parser.add_argument(
+            "--browser-profile",
+            type=str,
+            choices=BROWSER_PROFILES,
+            default=settings.BROWSER_PROFILE,
+            help="Chrome profile: default, or lean (headless, no images, fonts "
+            "or analytics, shared disk cache)",
+        )
 
     def chunked_generator(self, generator, chunk_size):
         """Split generator into chunks of given size."""
@@ -71,216 +123,112 @@ class Command(BaseCommand):
         for first in iterator:
             yield itertools.chain([first], itertools.islice(iterator, chunk_size - 1))
 
-    # Save and get last plate, skip plate function
-    def save_last_plate(self, plate, pattern):
-        """Save the last checked plate to the database."""
-        last_plate, created = LastPlatechecked.objects.get_or_create(pattern=pattern)
-        last_plate.plate = plate
-        last_plate.save()
-        print(f"Saved last checked plate: {formatted(plate)}")
-
-    def get_last_plate(self, pattern):
-        """Retrieve the most recently checked plate from the database."""
-        if pattern:
-            last_plate = LastPlatechecked.objects.filter(pattern=pattern).first()
-            return last_plate.plate if last_plate else None
-        return None
-
-    def skip_to_last_plate(self, generator, last_plate):
-        """Skip the generator to the plate after the last processed plate."""
-        skip = True
-        for plate in generator:
-            if skip and plate == last_plate:
-                skip = False  # Stop skipping once we reach the last plate
-                continue  # Skip the last plate itself
-            if not skip:
-                yield plate
-
-    def try_to_find_element(self, driver, by, value, max_retries=3):
-
-        max_retries = int(max_retries)
-        attempt = 0
-        while attempt < max_retries:
-            try:
-                element = driver.find_element(by, value)
-                print(f"Element found on attempt {attempt + 1}")
-                return element
-            except NoSuchElementException:
-                attempt += 1
-                print(f"Attempt {attempt} failed. Refreshing the page...")
-                t.sleep(5)
-                driver.refresh()
-        raise Exception(
-            f"Licence plate field not found after {max_retries} attempts."
-        )  # noqa
-
-    def scrape_license_plate(self, driver, plate):
-        """Scrape RDW data for a given license plate."""
+    def save_lookup(self, plate, result, record):
+        """
+        Update the vehicle of a license plate with the APK data looked up.
+
+        Returns:
+            str: "updated" or "unchanged" for the APK date, "unknown" if the
+            lookup failed, None if the plate is not in the database.
+        """
 
         try:
             vehicle_object = get_object_or_404(Vehicle, licence_plate=plate)
         except Http404:
             print(f"icense plate {plate} not found in the database.")
-            plate_instance, plate_created = UncheckedPlates.objects.get_or_create(
-                plate=plate,
-            )
-            if plate_created:
-                print(f"Adding plate {plate_instance.plate} to check it later...")
-            t.sleep(10)
+            self.queue_plate(plate)
             return
 
-        # Fill in the license plate
-        driver.get("https://ovi.rdw.nl/")
-        kenteken_input = self.try_to_find_element(
-            driver=driver, by=By.ID, value="kenteken", max_retries=3
-        )
-        kenteken_input.clear()
-
-        kenteken_input.send_keys(plate)
-        t.sleep(1)
-
-        # Click the search button
-        search_btn = driver.find_element(By.CLASS_NAME, "icon-search")
-        search_btn.click()
-        t.sleep(5)
+        if result == MISS:
+            print(
+                f"{Fore.RED}No car data found for license plate: {plate}{Style.RESET_ALL}"
+            )
+            print(
+                f"{Fore.RED}Marking vehicle {vehicle_object.display_name} with licence plate {plate} as archived!{Style.RESET_ALL}"
+            )
+            vehicle_object.archived = True
+            vehicle_object.save()
+            return "unknown"
 
-        try:
+        if result == ERROR:
+            self.queue_plate(plate)
+            return "unknown"
 
-            """
-            Expand history dropdown
-            Vervaldata en historie
-            """
-            expand_vervaldata_en_historie = driver.find_element(
-                By.ID,
-                "acc-overzicht-verval-historie-toggle",
-            )
-            expand_vervaldata_en_historie.click()
-            t.sleep(2)
+        first_reg = record.get("first_reg")
+        apk = record.get("apk")
 
-            # First Reg
-            first_reg_raw = get_text(driver, "Datum eerste toelating")
-            first_reg = get_date(first_reg_raw)
+        # Print all data
+        print(
+            f"{Fore.GREEN}Licence Plate: {formatted(plate)}, Make and Model: {vehicle_object.display_name}, First Reg: {first_reg}, APK: {apk}, Last_update: {vehicle_object.last_updated}{Style.RESET_ALL}"  # noqa
+        )
 
-            # First Reg in NL
-            first_reg_in_NL_raw = get_text(
-                driver, "Datum eerste tenaamstelling in Nederland"
+        # Check if APK has changed
+        if vehicle_object.apk != apk and apk:
+            print(
+                f"{Fore.GREEN}APK has changed for licence plate {Style.RESET_ALL}{Back.YELLOW}{formatted(plate)}{Style.RESET_ALL}{Fore.GREEN} from {vehicle_object.apk} to {Style.RESET_ALL}{Fore.WHITE}{Back.BLUE}{apk}{Style.RESET_ALL}"
             )
-            first_reg_in_NL = get_date(first_reg_in_NL_raw)
+            change = "updated"
+        else:
+            print(f"{Fore.RED}APK has not changed{Style.RESET_ALL}")
+            change = "unchanged"
 
-            # Imported in NL / assigned licence plate
-            imported_in_NL_raw = get_text(
-                driver, "Datum inschrijving voertuig in Nederland"
-            )
-            imported_in_NL = get_date(imported_in_NL_raw)
-
-            # APK
-            apk_raw = get_text(driver, "Vervaldatum APK")
-            apk = get_date(apk_raw)
-
-            """
-            Expand status dropdown
-            Status van het voertuig
-            """
-            expand_overzicht_status = driver.find_element(
-                By.ID,
-                "acc-overzicht-status-toggle",
-            )
-            expand_overzicht_status.click()
-            t.sleep(2)
-
-            exported_raw = get_text(driver, "Geëxporteerd")
-            if exported_raw == "Nee":
-                exported = False
-            else:
-                exported = True
-
-            # Insurance
-            insurance_raw = get_text(driver, "WAM-verzekerd")
-            if insurance_raw == "Nee":
-                insurance = False
-            else:
-                insurance = True
-
-            # Print all data
+        # Check if the APK date is in the future
+        if apk and apk > date.today():
             print(
-                f"{Fore.GREEN}Licence Plate: {formatted(plate)}, Make and Model: {vehicle_object.display_name}, First Reg: {first_reg}, APK: {apk}, Last_update: {vehicle_object.last_updated}{Style.RESET_ALL}"  # noqa
+                f"{Fore.GREEN}APK for {plate} is valid and in the future: {apk}{Style.RESET_ALL}"
             )
-
-            # Check if APK has changed
-            if vehicle_object.apk != apk and apk:
-                print(
-                    f"{Fore.GREEN}APK has changed for licence plate {Style.RESET_ALL}{Back.YELLOW}{formatted(plate)}{Style.RESET_ALL}{Fore.GREEN} from {vehicle_object.apk} to {Style.RESET_ALL}{Fore.WHITE}{Back.BLUE}{apk}{Style.RESET_ALL}"
-                )
-                self.updated_count += 1
-            else:
-                print(f"{Fore.RED}APK has not changed{Style.RESET_ALL}")
-                self.no_changes_count += 1
-
-            # Check if the APK date is in the future
-            if apk and apk > date.today():
-                print(
-                    f"{Fore.GREEN}APK for {plate} is valid and in the future: {apk}{Style.RESET_ALL}"
-                )
-            elif apk and apk <= date.today():
-                print(
-                    f"{Fore.RED}APK for {plate} is expired or in the past: {apk}{Style.RESET_ALL}"
-                )
-            else:
-                print(f"{Fore.YELLOW}No valid APK data for {plate}{Style.RESET_ALL}")
-
-            """
-            Save all data
-            """
-            # Update car instance
-            vehicle_object.first_reg = first_reg
-            vehicle_object.first_reg_in_NL = first_reg_in_NL
-            vehicle_object.imported_in_NL = imported_in_NL
-            vehicle_object.apk = apk
-            vehicle_object.exported = exported
-            vehicle_object.insurance = insurance
-
-            # Save the updated object
-            vehicle_object.save()
-
-            checked_plate = get_object_or_404(RecheckForAPKPlates, plate=plate)
-            checked_plate.delete()
+        elif apk and apk <= date.today():
             print(
-                f"{Fore.GREEN}Deleted plate {formatted(plate)} from UncheckedPlates{Style.RESET_ALL}"
+                f"{Fore.RED}APK for {plate} is expired or in the past: {apk}{Style.RESET_ALL}"
             )
+        else:
+            print(f"{Fore.YELLOW}No valid APK data for {plate}{Style.RESET_ALL}")
 
-            """
-            Print saved data
-            """
+        """
+        Save all data
+        """
+        # Update car instance, fields the backend did not supply keep their
+        # stored value
+        for field in APK_FIELDS:
+            if field in record:
+                setattr(vehicle_object, field, record[field])
+
+        # Save the updated object
+        vehicle_object.save()
+
+        checked_plate = get_object_or_404(RecheckForAPKPlates, plate=plate)
+        checked_plate.delete()
+        print(
+            f"{Fore.GREEN}Deleted plate {formatted(plate)} from UncheckedPlates{Style.RESET_ALL}"
+        )
+        return change
 
-        except NoSuchElementException:
-            # Check for "no car found" notification
-            self.unknown_count += 1
-            try:
-                no_data_notification = driver.find_element(
-                    By.CLASS_NAME, "notification-content"
-                )
-                if (
-                    "Er zijn geen voertuiggegevens gevonden"
-                    in no_data_notification.text
-                ):
-                    print(
-                        f"{Fore.RED}No car data found for license plate: {plate}{Style.RESET_ALL}"
-                    )
-                    print(
-                        f"{Fore.RED}Marking vehicle {vehicle_object.display_name} with licence plate {plate} as archived!{Style.RESET_ALL}"
-                    )
-                    vehicle_object.archived = True
-                    vehicle_object.save()
+    def queue_plate(self, plate):
+        """Queue a license plate in UncheckedPlates to look it up again later."""
+        plate_instance, plate_created = UncheckedPlates.objects.get_or_create(
+            plate=plate,
+        )
+        if plate_created:
+            print(f"Adding plate {plate_instance.plate} to check it later...")
 
-            except NoSuchElementException:
-                print(f"Unexpected structure for license plate: {plate}")
-                plate_instance, plate_created = UncheckedPlates.objects.get_or_create(
-                    plate=plate,
-                )
-                if plate_created:
-                    print(f"Adding plate {plate_instance.plate} to check it later...")
-                t.sleep(10)
-                return
+    def lookup(self, backend, plate):
+        """
+        Worker task of the backend pool: look up one plate and pause.
+
+        Runs in a worker thread, so it only reads the database; the calling
+        thread updates the vehicle with save_lookup().
+        """
+        print(
+            f"Processing licence plate: {Fore.BLACK}{Back.YELLOW}{formatted(plate)}{Style.RESET_ALL}"
+        )
+        if not Vehicle.objects.filter(licence_plate=plate).exists():
+            # Not looked up, save_lookup() queues the plate
+            return None, None
+        result, record = backend.fetch(plate)
+        if result == ERROR:
+            t.sleep(10)  # Give this browser a rest before its next plate
+        random_pause()  # Pause between requests of this browser
+        return result, record
 
     def handle(self, *args, **options):
         """
@@ -291,19 +239,26 @@ class Command(BaseCommand):
         self.no_changes_count = 0
         self.unknown_count = 0
 
-        pattern_to_function = {
-            "APK": generate_license_plates_from_db_for_APK_check,
+        pattern_to_source = {
+            "APK": pattern_apk.source,
         }
         # Init steps start
         print(Fore.GREEN + "Command executed!" + Style.RESET_ALL)
         start_time = datetime.now()  # Start timestamp
         print(f"Start time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(Fore.YELLOW + "Opening browser..." + Style.RESET_ALL)
-        driver = webdriver.Chrome()
-        # driver = webdriver.Chrome()
-        driver.get("https://ovi.rdw.nl/")
-        print(Fore.GREEN + "Browser open" + Style.RESET_ALL)
-        t.sleep(5)
+        # Only the APK, registration and status fields are needed
+        pool = BackendPool(
+            lambda: SupervisedBackend(
+                get_backend(
+                    options["backend"],
+                    fallback=not options["no_fallback"],
+                    profile="apk",
+                    headless=options["headless"],
+                    browser_profile=options["browser_profile"],
+                )
+            ),
+            options["browsers"],
+        )
         # Init steps done
 
         # Setting args from command
@@ -312,18 +267,9 @@ class Command(BaseCommand):
         pattern = options["pattern"]
         print(f"Pattern set to: {formatted(pattern)}")
 
-        # Retrieve the last plate checked
-        last_plate = self.get_last_plate(pattern)
-        if last_plate:
-            print(
-                f"Resuming from plate after: {Fore.BLACK}{Back.YELLOW}{formatted(last_plate)}{Style.RESET_ALL}"
-            )
-        else:
-            print("Starting from the beginning of the pattern.")
-
         # Check if the pattern exists in the mapping
-        if pattern in pattern_to_function:
-            plates_generator = pattern_to_function[pattern]()
+        if pattern in pattern_to_source:
+            plate_source = pattern_to_source[pattern]
         else:
             # Handle invalid patterns
             print(
@@ -331,39 +277,100 @@ class Command(BaseCommand):
             )
             return
 
-        try:
-            # Generate license plates
-            if last_plate:
-                plates_generator = self.skip_to_last_plate(plates_generator, last_plate)
-
-            # Process only one chunk
-            chunk = next(
-                self.chunked_generator(plates_generator, chunk_size),
-                None,
-            )
+        # --daemon keeps pulling chunks until stopped, a stop signal lets the
+        # current plates finish and the checkpoints be written first
+        daemon = options["daemon"]
+        stop = GracefulStop(on_stop=pool.stop)
+        heartbeat = Heartbeat(f"update_apk-{pattern}")
+        total_plates = 0
+        # The cursor is only dropped once every plate was checked
+        swept = False
 
-            if chunk:
-                print(f"Processing a new chunk of plates ({chunk_size} plates)...")
-                plate_start_time = t.time()  # Track time for plates
-                processed_plates = 0  # Track processed plates
-                for count, plate in enumerate(chunk, start=1):
+        try:
+            stop.install()
+            heartbeat.beat(force=True, state="running", pattern=pattern)
+            # Browsers are only started once the pattern is known to be
+            # valid, the finally block closes them whatever happens next
+            print(Fore.YELLOW + f"Opening {pool.name} backend..." + Style.RESET_ALL)
+            pool.open()
+            print(Fore.GREEN + "Backend open" + Style.RESET_ALL)
+            while True:
+                # Resume right after the last plate checked
+                start_index = get_resume_index(plate_source, pattern)
+
+                # Generate license plates
+                plates_generator = plate_source.iter_keyed(start_index)
+
+                # Process one chunk, or chunks until stopped as a daemon
+                chunk = None
+                for chunk in self.chunked_generator(plates_generator, chunk_size):
+                    chunk = list(chunk)
+                    plates = dict(chunk)
+                    # The cursor only moves past plates once all before them are done
+                    completed = CompletedPrefix(plates)
+                    print(f"Processing a new chunk of plates ({chunk_size} plates)...")
+                    plate_start_time = t.time()  # Track time for plates
+                    processed_plates = 0  # Track processed plates
+                    # Results of all workers arrive here, in the order they finish
+                    for count, (key, plate, (result, record)) in enumerate(
+                        pool.run(self.lookup, chunk), start=1
+                    ):
+                        print(
+                            f"Checked licence plate {count}/{len(chunk)}: {formatted(plate)}"
+                        )
+                        try:
+                            change = self.save_lookup(plate, result, record)
+                        except Exception as e:
+                            print(f"Saving {plate} failed: {e}")
+                            # Counted and queued like a failed lookup
+                            self.queue_plate(plate)
+                            change = "unknown"
+                        if change == "updated":
+                            self.updated_count += 1
+                        elif change == "unchanged":
+                            self.no_changes_count += 1
+                        elif change == "unknown":
+                            self.unknown_count += 1
+                        last_key = completed.complete(key)
+                        if last_key is not None:
+                            save_last_plate(plates[last_key], pattern, last_key)
+                        processed_plates += 1
+                        total_plates += 1
+                        heartbeat.beat(
+                            plates=total_plates,
+                            updated=self.updated_count,
+                            unchanged=self.no_changes_count,
+                            unknown=self.unknown_count,
+                            last_plate=plate,
+                        )
+                    print("Finished processing the chunk.")
+                    plate_end_time = t.time()  # End time for plates
+                    elapsed_time = plate_end_time - plate_start_time
+                    average_time_per_plate = (
+                        elapsed_time / processed_plates if processed_plates else 0
+                    )
+                    print(f"Elapsed time: {elapsed_time:.2f} seconds.")
                     print(
-                        f"Processing licence plate {count}/{chunk_size}: {Fore.BLACK}{Back.YELLOW}{formatted(plate)}{Style.RESET_ALL}"
+                        f"Average time per plate: {average_time_per_plate:.2f} seconds."
                     )
-                    self.scrape_license_plate(driver, plate)
-                    self.save_last_plate(plate, pattern)
-                    processed_plates += 1
-                    random_pause()  # Pause between requests
-                print("Finished processing the chunk. Command will now exit.")
-                plate_end_time = t.time()  # End time for plates
-                elapsed_time = plate_end_time - plate_start_time
-                average_time_per_plate = (
-                    elapsed_time / processed_plates if processed_plates else 0
-                )
-                print(f"Elapsed time: {elapsed_time:.2f} seconds.")
-                print(f"Average time per plate: {average_time_per_plate:.2f} seconds.")
-            else:
-                print("No more plates to process. Command will now exit.")
+                    if not daemon or stop.requested:
+                        break
+
+                if chunk is None:
+                    print("No more plates to process.")
+                    swept = True
+                if not daemon or stop.requested:
+                    break
+                if chunk is None:
+                    # Start over once new plates are due for a recheck
+                    LastPlatechecked.objects.filter(pattern=pattern).delete()
+                    swept = False
+                    heartbeat.beat(force=True, state="idle")
+                    print(f"Waiting {options['idle_sleep']} seconds for new plates...")
+                    if stop.wait(options["idle_sleep"]):
+                        break
+                    heartbeat.beat(force=True, state="running")
+            print("Command will now exit.")
 
         finally:
             # Closing steps start
@@ -382,11 +389,15 @@ class Command(BaseCommand):
                 + f"Total Count of Unknown APK data: {self.unknown_count}"
                 + Style.RESET_ALL
             )
-            print(Fore.YELLOW + "Deleting Last PLate..." + Style.RESET_ALL)
-            last_plate_object = get_object_or_404(LastPlatechecked, pattern=pattern)
-            last_plate_object.delete()
-            print(Fore.YELLOW + "Closing browser..." + Style.RESET_ALL)
-            driver.quit()
+            stop.restore()
+            # A stopped or failed run resumes from its checkpoint
+            if swept and not stop.requested:
+                print(Fore.YELLOW + "Deleting Last PLate..." + Style.RESET_ALL)
+                LastPlatechecked.objects.filter(pattern=pattern).delete()
+            print(Fore.YELLOW + "Closing backend..." + Style.RESET_ALL)
+            pool.close()
+            print_step_latencies()
+            heartbeat.beat(force=True, state="stopped", plates=total_plates)
             end_time = datetime.now()  # End timestamp
             print(f"End time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
             total_elapsed_time = (end_time - start_time).total_seconds()
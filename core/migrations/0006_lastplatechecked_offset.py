@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_recheckforapkplates_checked_apk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lastplatechecked',
+            name='offset',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
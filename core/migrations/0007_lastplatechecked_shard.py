@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_lastplatechecked_offset"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lastplatechecked",
+            name="shard",
+            field=models.CharField(blank=True, default="", max_length=32),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_lastplatechecked_shard"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lastplatechecked",
+            name="anchor",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="lastplatechecked",
+            name="order",
+            field=models.CharField(default="ascending", max_length=16),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_lastplatechecked_anchor_lastplatechecked_order"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PatternProgress",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("pattern", models.CharField(max_length=6, unique=True)),
+                ("highest_hit", models.CharField(blank=True, default="", max_length=6)),
+                ("highest_hit_offset", models.BigIntegerField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name_plural": "Pattern Progress",
+            },
+        ),
+    ]
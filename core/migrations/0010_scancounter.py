@@ -0,0 +1,36 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_patternprogress"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScanCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("pattern", models.CharField(max_length=6)),
+                ("hour", models.DateTimeField(db_index=True)),
+                ("hits", models.PositiveIntegerField(default=0)),
+                ("misses", models.PositiveIntegerField(default=0)),
+                ("errors", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "Scan Counters",
+                "unique_together": {("pattern", "hour")},
+            },
+        ),
+    ]
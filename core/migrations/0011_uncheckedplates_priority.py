@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_scancounter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uncheckedplates",
+            name="priority",
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+    ]
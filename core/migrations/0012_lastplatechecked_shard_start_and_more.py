@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_uncheckedplates_priority"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lastplatechecked",
+            name="shard_start",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="lastplatechecked",
+            name="shard_stop",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
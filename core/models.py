@@ -7,10 +7,19 @@ class LastPlatechecked(models.Model):
 
     pattern = models.CharField(max_length=6)
     plate = models.CharField(max_length=6)
+    offset = models.BigIntegerField(null=True, blank=True)
+    shard = models.CharField(max_length=32, blank=True, default="")
+    order = models.CharField(max_length=16, default="ascending")
+    anchor = models.BigIntegerField(null=True, blank=True)
+    # Steps of the shard, frozen when it is first assigned, no stop for the
+    # shard that runs to the end of the issued range
+    shard_start = models.BigIntegerField(null=True, blank=True)
+    shard_stop = models.BigIntegerField(null=True, blank=True)
 
 
 class UncheckedPlates(models.Model):
     plate = models.CharField(max_length=6)
+    priority = models.IntegerField(default=0, db_index=True)
 
 
 class LastPlateIssued(models.Model):
@@ -28,3 +37,24 @@ class RecheckForAPKPlates(models.Model):
     first_reg = models.DateField(null=True, blank=True)
     apk = models.DateField(null=True, blank=True)
     checked_apk = models.DateField(null=True, blank=True)
+
+
+class PatternProgress(models.Model):
+    class Meta:
+        verbose_name_plural = "Pattern Progress"
+
+    pattern = models.CharField(max_length=6, unique=True)
+    highest_hit = models.CharField(max_length=6, blank=True, default="")
+    highest_hit_offset = models.BigIntegerField(null=True, blank=True)
+
+
+class ScanCounter(models.Model):
+    class Meta:
+        verbose_name_plural = "Scan Counters"
+        unique_together = ("pattern", "hour")
+
+    pattern = models.CharField(max_length=6)
+    hour = models.DateTimeField(db_index=True)
+    hits = models.PositiveIntegerField(default=0)
+    misses = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
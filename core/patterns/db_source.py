@@ -0,0 +1,81 @@
+"""
+Keyset access to plate sources backed by a table.
+
+The offset of a plate in these sources is the primary key of its row, so a
+cursor resumes with ``WHERE id >= key`` instead of skipping rows, and gaps
+left by deleted rows are simply not visited. Rows are streamed through
+server-side cursors in primary key order, so memory stays flat.
+"""
+
+# Rows fetched per round trip of a server-side cursor
+STREAM_CHUNK_SIZE = 2000
+
+
+def key_space(queryset):
+    """Return one past the highest primary key, 0 for an empty table."""
+    last_id = queryset.order_by("-id").values_list("id", flat=True).first()
+    return 0 if last_id is None else last_id + 1
+
+
+def key_of(queryset, field, plate):
+    """Return the primary key of a plate, raises ValueError if it is not there."""
+    row_id = queryset.filter(**{field: plate}).values_list("id", flat=True).first()
+    if row_id is None:
+        raise ValueError(f"Plate {plate!r} is not part of this source")
+    return row_id
+
+
+def plate_at(queryset, field, key):
+    """Return the plate stored under a primary key, raises IndexError if none."""
+    plate = queryset.filter(id=key).values_list(field, flat=True).first()
+    if plate is None:
+        raise IndexError(f"Key {key} is not part of this source")
+    return plate
+
+
+def keyed_plates(queryset, field, key=0, stop=None):
+    """Stream (key, plate) pairs in primary key order from a key up to stop (excluded)."""
+    rows = queryset.filter(id__gte=key)
+    if stop is not None:
+        rows = rows.filter(id__lt=stop)
+    rows = rows.order_by("id").values_list("id", field)
+    yield from rows.iterator(chunk_size=STREAM_CHUNK_SIZE)
+
+
+class KeyedQuerysetSource:
+    """
+    Plate source over the rows of a queryset, keyed by primary key.
+
+    size() is one past the highest key, the range keys are drawn from, not
+    the number of plates. Scan coverage leaves these sources out.
+
+    Args:
+        get_queryset: Callable returning the rows, called on every access
+            so rows added while a scan runs are seen.
+        field (str): The field holding the plate.
+    """
+
+    def __init__(self, get_queryset, field="plate"):
+        self.get_queryset = get_queryset
+        self.field = field
+
+    def size(self):
+        """Return one past the highest key, keys are primary keys."""
+        return key_space(self.get_queryset())
+
+    def rank(self, plate):
+        """Return the key of a plate, raises ValueError if it is not in the source."""
+        return key_of(self.get_queryset(), self.field, plate)
+
+    def unrank(self, key):
+        """Return the plate stored under a key, raises IndexError if there is none."""
+        return plate_at(self.get_queryset(), self.field, key)
+
+    def iter_keyed(self, key=0, stop=None):
+        """Yield (key, plate) pairs in key order, starting at the given key."""
+        return keyed_plates(self.get_queryset(), self.field, key, stop)
+
+    def iter_from(self, key=0):
+        """Yield the plates of the source starting at the given key."""
+        for key, plate in self.iter_keyed(key):
+            yield plate
@@ -0,0 +1,55 @@
+"""
+Plate exclusion rules, loaded from exclusion_rules.json.
+
+Every rule names letters that are never issued and/or letter sequences
+that are never issued inside a group. Every sidecode lists the rules it
+follows. Bump "version" whenever rules change: offsets in a sidecode shift
+with its rules, so data indexed by offset is kept per version.
+"""
+
+import json
+import os
+
+from core.patterns.sidecode import compile_sidecode
+
+RULES_PATH = os.path.join(os.path.dirname(__file__), "exclusion_rules.json")
+
+
+def load_rules(path=RULES_PATH):
+    """Return the rules file as a dict with "version", "rules" and "sidecodes"."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compile_rules(rules, rule_ids):
+    """
+    Return the excluded letters and sequences of a list of rules.
+
+    Raises:
+        ValueError: If a rule id is not defined.
+    """
+    excluded_letters = set()
+    excluded_sequences = set()
+    for rule_id in rule_ids:
+        if rule_id not in rules:
+            raise ValueError(f"Unknown exclusion rule {rule_id!r}")
+        excluded_letters.update(rules[rule_id].get("letters", ()))
+        excluded_sequences.update(rules[rule_id].get("sequences", ()))
+    return excluded_letters, excluded_sequences
+
+
+def compile_pattern(data, pattern, skip_rule=None):
+    """
+    Compile the sidecode of a pattern with its rules, optionally leaving one out.
+
+    Args:
+        data (dict): The loaded rules file.
+        pattern (str): Pattern name, e.g. "99XXX9".
+        skip_rule (str): Rule id to leave out, to measure what it excludes.
+    """
+    sidecode = data["sidecodes"][pattern]
+    rule_ids = [rule_id for rule_id in sidecode["rules"] if rule_id != skip_rule]
+    excluded_letters, excluded_sequences = compile_rules(data["rules"], rule_ids)
+    return compile_sidecode(
+        sidecode["spec"], excluded_letters, excluded_sequences, sidecode.get("order")
+    )
@@ -1,16 +1,15 @@
 from vehicles.models import Vehicle
+from core.patterns.db_source import KeyedQuerysetSource
 
 
-def generate_license_plates_from_db():
+def get_queryset():
     """
-    Generator to yield license plates from the Vehicle model
-    where the vehicle_category.name is 'undefined'.
+    Vehicles where the vehicle_category.name is 'undefined',
+    ordered by primary key so every index is stable between runs.
     """
-    vehicles = Vehicle.objects.filter(
+    return Vehicle.objects.filter(
         vehicle_category__name="undefined"  # Filter by related field
-    ).values_list(
-        "licence_plate", flat=True
-    )  # Only get licence_plate field
+    ).order_by("id")
 
-    for licence_plate in vehicles:
-        yield licence_plate
+
+source = KeyedQuerysetSource(get_queryset, "licence_plate")
@@ -0,0 +1,118 @@
+from django.db.models import Q
+
+from core.models import LastPlateIssued, PatternProgress
+from core.patterns.sidecodes import plate_pattern, sidecodes
+
+
+def get_issued_frontier(pattern, source):
+    """
+    Return the offset of the newest issued plate of a pattern.
+
+    Args:
+        pattern (str): The pattern name, e.g. "XXX99X".
+        source: Plate source exposing rank().
+
+    Returns:
+        int: The offset of the plate, or None if no plate of the pattern
+        was recorded by get_latest_plate or it is not part of the source.
+    """
+    last_issued = (
+        LastPlateIssued.objects.filter(pattern=pattern).order_by("-id").first()
+    )
+    if not last_issued:
+        return None
+    try:
+        return source.rank(last_issued.plate)
+    except ValueError:
+        return None
+
+
+def get_issued_delta():
+    """
+    Yield the plates issued between the two newest LastPlateIssued rows.
+
+    Plates after the older snapshot up to and including the newer one are
+    yielded in issue order. When the newer snapshot is in another sidecode,
+    the rest of the older sidecode is yielded first.
+    """
+    snapshots = list(LastPlateIssued.objects.order_by("-id")[:2])
+    if len(snapshots) < 2:
+        return
+    latest, previous = snapshots
+    latest_sidecode = sidecodes.get(latest.pattern)
+    previous_sidecode = sidecodes.get(previous.pattern)
+    if latest_sidecode is None or previous_sidecode is None:
+        return
+    try:
+        latest_offset = latest_sidecode.rank(latest.plate)
+        previous_offset = previous_sidecode.rank(previous.plate)
+    except ValueError:
+        return
+
+    if latest.pattern == previous.pattern:
+        for offset, plate in latest_sidecode.iter_keyed(
+            previous_offset + 1, latest_offset + 1
+        ):
+            yield plate
+        return
+    for offset, plate in previous_sidecode.iter_keyed(previous_offset + 1):
+        yield plate
+    for offset, plate in latest_sidecode.iter_keyed(0, latest_offset + 1):
+        yield plate
+
+
+def get_current_pattern():
+    """Return the pattern plates are currently issued in, if known."""
+    return (
+        LastPlateIssued.objects.order_by("-id")
+        .values_list("pattern", flat=True)
+        .first()
+    )
+
+
+def get_scan_bound(pattern, margin):
+    """
+    Return the highest offset of a sidecode that can hold an issued plate.
+
+    Plates are issued in sequence, so nothing after the newest issued plate
+    of the current pattern exists yet. A series that is no longer issued is
+    bounded `margin` plates past the highest of its recorded frontier and
+    its highest confirmed hit.
+
+    Returns:
+        int: The bound, or None if nothing is known about the pattern.
+    """
+    sidecode = sidecodes.get(pattern)
+    if sidecode is None:
+        return None
+    frontier = get_issued_frontier(pattern, sidecode)
+    if frontier is not None and pattern == get_current_pattern():
+        return frontier
+
+    highest_hit = (
+        PatternProgress.objects.filter(pattern=pattern)
+        .values_list("highest_hit_offset", flat=True)
+        .first()
+    )
+    known = [offset for offset in (frontier, highest_hit) if offset is not None]
+    if not known:
+        return None
+    return max(known) + margin
+
+
+def record_hit(plate):
+    """Keep the highest confirmed hit of the sidecode a plate belongs to."""
+    pattern = plate_pattern(plate)
+    sidecode = sidecodes.get(pattern)
+    if sidecode is None:
+        return
+    try:
+        offset = sidecode.rank(plate)
+    except ValueError:
+        return
+
+    PatternProgress.objects.get_or_create(pattern=pattern)
+    # Conditional update so parallel shard workers never lower the value
+    PatternProgress.objects.filter(pattern=pattern).filter(
+        Q(highest_hit_offset__isnull=True) | Q(highest_hit_offset__lt=offset)
+    ).update(highest_hit=plate, highest_hit_offset=offset)
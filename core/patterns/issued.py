@@ -0,0 +1,13 @@
+from core.models import UncheckedPlates
+from core.patterns.db_source import KeyedQuerysetSource
+
+# Priority of plates issued since the previous LastPlateIssued snapshot
+HIGH_PRIORITY = 10
+
+
+def get_queryset():
+    """High priority unchecked plates ordered by primary key."""
+    return UncheckedPlates.objects.filter(priority__gte=HIGH_PRIORITY).order_by("id")
+
+
+source = KeyedQuerysetSource(get_queryset, "plate")
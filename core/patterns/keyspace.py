@@ -0,0 +1,148 @@
+from itertools import product
+
+DIGITS = "0123456789"
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class PlateKeyspace:
+    """
+    Exact, constant time rank/unrank over the plates of one pattern.
+
+    The keyspace is described in iteration order (the order of the nested
+    loops of the original generator, most significant position first):
+
+    Args:
+        alphabets (list[str]): Allowed characters for every position.
+        linked (set[int]): Positions ``i`` that form one run with ``i + 1``,
+            every run is checked against ``excluded_sequences``.
+        excluded_sequences (set[str]): Letter combinations to skip when they
+            appear anywhere inside a run, e.g. {"SS", "SD"}.
+        layout (list[int]): For every character of the plate, the iteration
+            position it comes from. Defaults to the iteration order.
+
+    Linked positions are grouped into segments (runs). Every segment is enumerated
+    once into a small lookup table, so a plate index is a plain mixed-radix
+    number over the segments.
+    """
+
+    def __init__(self, alphabets, linked=(), excluded_sequences=(), layout=None):
+        self.length = len(alphabets)
+        self.layout = list(layout) if layout is not None else None
+        excluded_sequences = set(excluded_sequences)
+
+        # Split the positions into runs checked against the sequences
+        self.segments = [[0]]
+        for position in range(1, self.length):
+            if position - 1 in linked:
+                self.segments[-1].append(position)
+            else:
+                self.segments.append([position])
+
+        # Enumerate the valid values of every segment in iteration order
+        self.values = []
+        self.indexes = []
+        for segment in self.segments:
+            values = []
+            for chars in product(*(alphabets[position] for position in segment)):
+                value = "".join(chars)
+                if any(sequence in value for sequence in excluded_sequences):
+                    continue
+                values.append(value)
+            self.values.append(values)
+            self.indexes.append({value: index for index, value in enumerate(values)})
+
+        # Weight of every segment in the mixed-radix index
+        self.radixes = [len(values) for values in self.values]
+        self.weights = []
+        weight = 1
+        for radix in reversed(self.radixes):
+            self.weights.insert(0, weight)
+            weight *= radix
+        self._size = weight
+
+    def size(self):
+        """Return the number of plates in the keyspace."""
+        return self._size
+
+    def _to_plate(self, chars):
+        """Reorder characters from iteration order into plate order."""
+        if self.layout is None:
+            return chars
+        return "".join(chars[position] for position in self.layout)
+
+    def _from_plate(self, plate):
+        """Reorder characters from plate order into iteration order."""
+        if self.layout is None:
+            return plate
+        chars = [""] * self.length
+        for plate_position, position in enumerate(self.layout):
+            chars[position] = plate[plate_position]
+        return "".join(chars)
+
+    def rank(self, plate):
+        """
+        Return the index of a plate in the keyspace.
+
+        Raises:
+            ValueError: If the plate is not part of the keyspace.
+        """
+        if not isinstance(plate, str) or len(plate) != self.length:
+            raise ValueError(f"Plate {plate!r} is not part of this keyspace")
+        chars = self._from_plate(plate)
+        index = 0
+        for segment, lookup, weight in zip(self.segments, self.indexes, self.weights):
+            value = chars[segment[0] : segment[-1] + 1]
+            if value not in lookup:
+                raise ValueError(f"Plate {plate!r} is not part of this keyspace")
+            index += lookup[value] * weight
+        return index
+
+    def _digits(self, index):
+        """Split an index into one digit per segment."""
+        digits = []
+        for weight in self.weights:
+            digit, index = divmod(index, weight)
+            digits.append(digit)
+        return digits
+
+    def unrank(self, index):
+        """
+        Return the plate at a given index of the keyspace.
+
+        Raises:
+            IndexError: If the index is outside of the keyspace.
+        """
+        if not 0 <= index < self._size:
+            raise IndexError(f"Index {index} is outside of this keyspace")
+        chars = "".join(
+            values[digit] for values, digit in zip(self.values, self._digits(index))
+        )
+        return self._to_plate(chars)
+
+    def iter_keyed(self, index=0, stop=None):
+        """Yield (index, plate) pairs from an index up to stop (excluded)."""
+        stop = self._size if stop is None else min(stop, self._size)
+        return zip(range(max(index, 0), stop), self.iter_from(index))
+
+    def iter_from(self, index=0):
+        """Yield the plates of the keyspace, starting at the given index."""
+        if index >= self._size:
+            return
+        digits = self._digits(max(index, 0))
+        parts = [values[digit] for values, digit in zip(self.values, digits)]
+        last = len(digits) - 1
+        while True:
+            yield self._to_plate("".join(parts))
+
+            # Advance the mixed-radix counter, least significant segment first
+            position = last
+            while position >= 0:
+                digits[position] += 1
+                if digits[position] < self.radixes[position]:
+                    parts[position] = self.values[position][digits[position]]
+                    break
+                digits[position] = 0
+                parts[position] = self.values[position][0]
+                position -= 1
+            if position < 0:
+                return
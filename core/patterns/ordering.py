@@ -0,0 +1,114 @@
+ORDERS = ("ascending", "backward", "outward")
+
+
+def step_to_offset(step, size, anchor, order):
+    """
+    Return the keyspace offset visited at a given step of an order.
+
+    Args:
+        step (int): Position in the scan order.
+        size (int): Number of plates in the keyspace.
+        anchor (int): Offset the scan starts from (the issuance frontier).
+        order (str): "ascending" from the first plate, "backward" from the
+            anchor down to the first plate and then up from the anchor, or
+            "outward" alternating below and above the anchor.
+    """
+    if order == "backward":
+        return anchor - step if step <= anchor else step
+    if order == "outward":
+        pairs = min(anchor, size - anchor - 1)
+        if step == 0:
+            return anchor
+        if step <= 2 * pairs:
+            distance = (step + 1) // 2
+            return anchor - distance if step % 2 else anchor + distance
+        # One side is used up, continue on the other one
+        distance = step - pairs
+        return anchor - distance if anchor > size - anchor - 1 else anchor + distance
+    return step
+
+
+def offset_to_step(offset, size, anchor, order):
+    """Return the step at which an order visits a keyspace offset."""
+    if order == "backward":
+        return anchor - offset if offset <= anchor else offset
+    if order == "outward":
+        pairs = min(anchor, size - anchor - 1)
+        distance = abs(offset - anchor)
+        if distance <= pairs:
+            return 2 * distance - 1 if offset < anchor else 2 * distance
+        return pairs + distance
+    return offset
+
+
+class OrderedSource:
+    """
+    Plate source that visits another source in a given order.
+
+    Offsets of this source are steps of the order, so cursors, shards and
+    rank/unrank work on it exactly like on the source it wraps. Offsets of
+    the wrapped source above `bound` cannot hold an issued plate and are
+    skipped.
+    """
+
+    def __init__(self, source, order="ascending", anchor=0, bound=None):
+        self.source = source
+        self.order = order
+        self.bound = bound
+        self._size = source.size()
+        if bound is not None:
+            anchor = min(anchor, bound)
+        self.anchor = min(max(anchor, 0), self._size - 1)
+
+    def size(self):
+        """Return the number of plates in the source."""
+        return self._size
+
+    def offset(self, step):
+        """Return the offset of the wrapped source visited at a step."""
+        return step_to_offset(step, self._size, self.anchor, self.order)
+
+    def stop(self):
+        """Return the step after which every offset is past the bound."""
+        if self.bound is None or self.bound >= self._size - 1:
+            return self._size
+        if self.bound < 0:
+            return 0
+        last_step = max(
+            offset_to_step(offset, self._size, self.anchor, self.order)
+            for offset in (0, self.bound)
+        )
+        return last_step + 1
+
+    def rank(self, plate):
+        """Return the step of a plate, raises ValueError if unknown."""
+        return offset_to_step(
+            self.source.rank(plate), self._size, self.anchor, self.order
+        )
+
+    def unrank(self, step):
+        """Return the plate visited at a step, raises IndexError if out of range."""
+        if not 0 <= step < self._size:
+            raise IndexError(f"Step {step} is outside of this source")
+        return self.source.unrank(self.offset(step))
+
+    def iter_steps(self, step=0, stop=None):
+        """Yield (step, plate) pairs in order, skipping plates past the bound."""
+        stop = self.stop() if stop is None else min(stop, self.stop())
+        step = max(step, 0)
+        if step >= stop:
+            return
+        if self.order == "ascending":
+            # Offsets and steps are the same, keep the fast path of the source
+            yield from self.source.iter_keyed(step, stop)
+            return
+        for current in range(step, stop):
+            offset = self.offset(current)
+            if self.bound is not None and offset > self.bound:
+                continue
+            yield current, self.source.unrank(offset)
+
+    def iter_from(self, step=0):
+        """Yield the plates of the source in order, starting at a step."""
+        for current, plate in self.iter_steps(step):
+            yield plate
@@ -1,9 +1,10 @@
 from core.models import RecheckForAPKPlates
+from core.patterns.db_source import KeyedQuerysetSource
 
 
-def generate_license_plates_from_db_for_APK_check():
-    """
-    Generator to yield license plates from the Car model.
-    """
-    for vehicle in RecheckForAPKPlates.objects.values_list("plate", flat=True):
-        yield vehicle
+def get_queryset():
+    """Plates to recheck ordered by primary key so every index is stable."""
+    return RecheckForAPKPlates.objects.order_by("id")
+
+
+source = KeyedQuerysetSource(get_queryset, "plate")
@@ -0,0 +1,79 @@
+from core.patterns.keyspace import DIGITS, LETTERS
+
+# Bits below the shape id, 26**6 codes of the widest shape fit in 32 bits
+SHAPE_BITS = 32
+
+PLATE_LENGTH = 6
+
+
+def shape_id(pattern):
+    """Return the number of a pattern, one bit per letter position (XX9999 = 48)."""
+    return sum(
+        1 << (PLATE_LENGTH - 1 - i) for i, char in enumerate(pattern) if char == "X"
+    )
+
+
+def encode_plate(plate):
+    """
+    Pack a plate into an integer that sorts like the plate within its pattern.
+
+    Args:
+        plate (str): Plate without dashes, e.g. "01BBB1".
+
+    Returns:
+        int: shape_id(pattern) << SHAPE_BITS | position of the plate in all
+        plates of its pattern (letters base 26, digits base 10, left to
+        right), or None if the plate is not six letters and digits.
+    """
+    if len(plate) != PLATE_LENGTH:
+        return None
+    shape = 0
+    value = 0
+    for char in plate:
+        shape <<= 1
+        if char in DIGITS:
+            value = value * 10 + ord(char) - 48
+        elif char in LETTERS:
+            shape |= 1
+            value = value * 26 + ord(char) - 65
+        else:
+            return None
+    return shape << SHAPE_BITS | value
+
+
+def decode_plate(code):
+    """Return the plate packed by encode_plate."""
+    shape = code >> SHAPE_BITS
+    value = code & ((1 << SHAPE_BITS) - 1)
+    chars = []
+    for position in range(PLATE_LENGTH):
+        if shape >> position & 1:
+            value, digit = divmod(value, 26)
+            chars.append(chr(65 + digit))
+        else:
+            value, digit = divmod(value, 10)
+            chars.append(chr(48 + digit))
+    return "".join(reversed(chars))
+
+
+def code_range(pattern, first=None, last=None):
+    """
+    Return the (lowest, highest) codes of a pattern, both included.
+
+    Args:
+        pattern (str): Pattern like "99XXX9".
+        first (str): First plate of the range, the first plate of the pattern if None.
+        last (str): Last plate of the range, the last plate of the pattern if None.
+
+    Raises:
+        ValueError: If first or last is not a plate of the pattern.
+    """
+    if first is None:
+        first = "".join("A" if char == "X" else "0" for char in pattern)
+    if last is None:
+        last = "".join("Z" if char == "X" else "9" for char in pattern)
+    low, high = encode_plate(first), encode_plate(last)
+    for code in (low, high):
+        if code is None or code >> SHAPE_BITS != shape_id(pattern):
+            raise ValueError(f"Range {first}-{last} is not in pattern {pattern}")
+    return low, high
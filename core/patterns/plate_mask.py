@@ -0,0 +1,141 @@
+import re
+from itertools import product
+
+from django.db.models import Q
+
+from core.patterns.keyspace import DIGITS, LETTERS
+from core.patterns.plate_code import encode_plate
+from core.patterns.sidecodes import sidecodes
+
+# Most index ranges one alignment of a mask expands to, enough for two
+# leading letter wildcards ("??-25-GP"), the rest is left to a regex
+MAX_RANGES = 1000
+
+MASK_CHARACTERS = set(DIGITS + LETTERS + "?*-")
+
+
+def _align(mask, spec):
+    """
+    Yield every way a mask lines up with a sidecode spec.
+
+    `?` matches one character, `*` any number of characters within a group
+    and `-` a dash, letters and digits match themselves on letter and digit
+    positions. Every alignment is a tuple with the required character of
+    every plate position, None where any character is allowed.
+    """
+
+    def match(i, j, constraints):
+        if j == len(mask):
+            if i == len(spec):
+                yield tuple(constraints)
+            return
+        token = mask[j]
+        if token == "*":
+            end = i
+            while True:
+                yield from match(end, j + 1, constraints + [None] * (end - i))
+                if end == len(spec) or spec[end] == "-":
+                    return
+                end += 1
+        if i == len(spec):
+            return
+        if token == "-" or spec[i] == "-":
+            if token == spec[i]:
+                yield from match(i + 1, j + 1, constraints)
+            return
+        if token == "?":
+            yield from match(i + 1, j + 1, constraints + [None])
+        elif (token in LETTERS) == (spec[i] == "X"):
+            yield from match(i + 1, j + 1, constraints + [token])
+
+    yield from match(0, 0, [])
+
+
+def _ranges(pattern, constraints):
+    """
+    Return the code ranges and the regex (or None) matching one alignment.
+
+    Wildcards in front of the last fixed character are expanded into
+    separate ranges from the left while that stays within MAX_RANGES. The
+    first wildcard that does not fit ends the fixed prefix of every range,
+    a regex checks the characters after it.
+    """
+    alphabets = [LETTERS if char == "X" else DIGITS for char in pattern]
+    fixed = [i for i, char in enumerate(constraints) if char is not None]
+    last_fixed = fixed[-1] if fixed else -1
+    free = [i for i in range(last_fixed) if constraints[i] is None]
+
+    count = 1
+    expanded = []
+    for i in free:
+        if count * len(alphabets[i]) > MAX_RANGES:
+            break
+        count *= len(alphabets[i])
+        expanded.append(i)
+    regex = None
+    if len(expanded) < len(free):
+        last_fixed = free[len(expanded)] - 1
+        # Wildcards right before the cut would only split the range up
+        while expanded and expanded[-1] == last_fixed:
+            expanded.pop()
+            last_fixed -= 1
+        free = expanded
+        regex = "^" + "".join(char or "." for char in constraints) + "$"
+
+    ranges = []
+    for values in product(*(alphabets[i] for i in free)):
+        plate = list(constraints)
+        for i, value in zip(free, values):
+            plate[i] = value
+        prefix = "".join(plate[: last_fixed + 1])
+        tail = alphabets[last_fixed + 1 :]
+        low = prefix + "".join(alphabet[0] for alphabet in tail)
+        high = prefix + "".join(alphabet[-1] for alphabet in tail)
+        ranges.append((encode_plate(low), encode_plate(high)))
+    return ranges, regex
+
+
+def compile_plate_mask(mask):
+    """
+    Compile a wildcard plate mask into code ranges per sidecode.
+
+    Args:
+        mask (str): Plate mask like "GP-25-??" or "*-XXX-9". With dashes the
+            groups have to line up with the groups of a sidecode, without
+            them only the characters do.
+
+    Returns:
+        list: (pattern, ranges, regex) tuples, ranges are (low, high)
+        plate_code pairs (both included) and regex is a licence_plate regex
+        the rows in the ranges still have to match, or None.
+
+    Raises:
+        ValueError: If the mask holds anything else than letters, digits,
+            `?`, `*` and `-`.
+    """
+    mask = re.sub(r"\s", "", mask.upper())
+    if not mask or not set(mask) <= MASK_CHARACTERS:
+        raise ValueError(
+            f"Invalid plate mask '{mask}', use letters, digits, ?, * and -"
+        )
+
+    compiled = []
+    for pattern, sidecode in sidecodes.items():
+        spec = sidecode.spec if "-" in mask else pattern
+        for constraints in set(_align(mask, spec)):
+            ranges, regex = _ranges(pattern, constraints)
+            compiled.append((pattern, ranges, regex))
+    return compiled
+
+
+def plate_mask_q(mask):
+    """Return a Q filtering vehicles on a plate mask through plate_code ranges."""
+    query = Q(pk__in=[])
+    for pattern, ranges, regex in compile_plate_mask(mask):
+        in_ranges = Q()
+        for low, high in ranges:
+            in_ranges |= Q(plate_code__range=(low, high))
+        if regex:
+            in_ranges &= Q(licence_plate__regex=regex)
+        query |= in_ranges
+    return query
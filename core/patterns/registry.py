@@ -0,0 +1,25 @@
+"""
+Plate sources by pattern name.
+
+Every source exposes ``rank(plate)``, ``unrank(index)``, ``size()``,
+``iter_keyed(index, stop)`` and ``iter_from(index)`` so a scan can resume
+from an integer offset. Offsets of database sources are primary keys, so
+their size() is a key space rather than a number of plates.
+"""
+
+from core.patterns import from_db, issued, test_plates, unchecked
+from core.patterns.db_source import KeyedQuerysetSource
+from core.patterns.sidecodes import sidecodes
+
+pattern_to_source = {
+    **sidecodes,
+    "FROMDB": from_db.source,
+    "ISSUED": issued.source,
+    "TEST": test_plates,
+    "UNCHEC": unchecked.source,
+}
+
+
+def has_plate_count(source):
+    """Return True if size() of a source is its number of plates."""
+    return not isinstance(source, KeyedQuerysetSource)
@@ -0,0 +1,111 @@
+import numpy as np
+
+from core.patterns.keyspace import DIGITS, LETTERS, PlateKeyspace
+
+
+class Sidecode(PlateKeyspace):
+    """
+    Keyspace of a Dutch sidecode compiled from a spec like "99-XXX-9".
+
+    On top of the rank/unrank API it emits plates in NumPy-vectorized
+    blocks: a block of indexes is split into segment digits with divmod and
+    every segment is copied from its lookup table in one array operation.
+    """
+
+    def __init__(self, spec, alphabets, linked, excluded_sequences, order):
+        layout = [order.index(position) for position in range(len(order))]
+        super().__init__(alphabets, linked, excluded_sequences, layout)
+        self.spec = spec
+        self.pattern = spec.replace("-", "")
+
+        # Segment lookup tables as uint8 arrays of shape (radix, segment length)
+        self.tables = [
+            np.frombuffer("".join(values).encode("ascii"), dtype=np.uint8).reshape(
+                len(values), len(segment)
+            )
+            for values, segment in zip(self.values, self.segments)
+        ]
+        # Plate columns filled by every segment
+        self.columns = [
+            [order[position] for position in segment] for segment in self.segments
+        ]
+
+    def blocks(self, start=0, stop=None, block_size=65536):
+        """
+        Yield the plates between two indexes as NumPy arrays of strings.
+
+        Args:
+            start (int): Index of the first plate.
+            stop (int): Index after the last plate, defaults to the keyspace size.
+            block_size (int): Number of plates per block.
+        """
+        stop = self.size() if stop is None else min(stop, self.size())
+        for block_start in range(max(start, 0), stop, block_size):
+            indexes = np.arange(
+                block_start, min(block_start + block_size, stop), dtype=np.int64
+            )
+            plates = np.empty((len(indexes), self.length), dtype=np.uint8)
+            for table, columns, weight in zip(self.tables, self.columns, self.weights):
+                digits, indexes = np.divmod(indexes, weight)
+                plates[:, columns] = table[digits]
+            yield plates.view(f"S{self.length}").ravel().astype(f"U{self.length}")
+
+    def iter_from(self, index=0, block_size=4096):
+        """Yield the plates of the sidecode, starting at the given index."""
+        for block in self.blocks(index, block_size=block_size):
+            yield from block.tolist()
+
+
+def compile_sidecode(spec, excluded_letters=(), excluded_sequences=(), order=None):
+    """
+    Compile a sidecode spec into a Sidecode.
+
+    Args:
+        spec (str): Groups of "X" (letter) and "9" (digit) separated by
+            dashes, e.g. "99-XXX-9".
+        excluded_letters (set[str]): Letters that are never issued.
+        excluded_sequences (set[str]): Letter combinations that are never
+            issued next to each other inside a group, e.g. {"SS", "SD"}.
+        order (list[int]): Plate positions from most to least significant.
+            Defaults to left to right.
+
+    Returns:
+        Sidecode: The compiled keyspace.
+
+    Raises:
+        ValueError: If the spec is invalid, or the order separates two
+            letters of one group while sequences are excluded.
+    """
+    pattern = spec.replace("-", "")
+    if not pattern or set(pattern) - {"X", "9"}:
+        raise ValueError(f"Invalid sidecode spec: {spec!r}")
+
+    # Group number of every plate position
+    groups = []
+    for group, part in enumerate(spec.split("-")):
+        groups.extend([group] * len(part))
+
+    letters = "".join(char for char in LETTERS if char not in set(excluded_letters))
+    order = list(order) if order is not None else list(range(len(pattern)))
+    if sorted(order) != list(range(len(pattern))):
+        raise ValueError(f"Invalid order {order} for sidecode {spec!r}")
+    alphabets = [letters if pattern[position] == "X" else DIGITS for position in order]
+
+    # Adjacent letters inside a group are checked against the sequences
+    letter_pairs = {
+        position
+        for position in range(len(pattern) - 1)
+        if pattern[position] == pattern[position + 1] == "X"
+        and groups[position] == groups[position + 1]
+    }
+    linked = set()
+    if excluded_sequences:
+        for position in letter_pairs:
+            first = order.index(position)
+            if order.index(position + 1) != first + 1:
+                raise ValueError(
+                    f"Order {order} separates letters {position} and {position + 1} of sidecode {spec!r}"
+                )
+            linked.add(first)
+
+    return Sidecode(spec, alphabets, linked, excluded_sequences, order)
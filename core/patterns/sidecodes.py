@@ -0,0 +1,54 @@
+import numpy as np
+
+from core.patterns.plate_code import SHAPE_BITS, encode_plate, shape_id
+from core.patterns.exclusion_rules import compile_pattern, load_rules
+
+# Exclusion rules every sidecode is compiled with
+exclusion_rules = load_rules()
+RULES_VERSION = exclusion_rules["version"]
+
+# Sidecodes by pattern name, compiled from their spec and rules
+sidecodes = {
+    pattern: compile_pattern(exclusion_rules, pattern)
+    for pattern in exclusion_rules["sidecodes"]
+}
+
+
+def plate_pattern(plate):
+    """Return the pattern of a plate, e.g. "XXX99X" for "GBB01B"."""
+    return "".join("X" if char.isalpha() else "9" for char in plate)
+
+
+# Sidecode name of every shape_id, "" for shapes that are not a sidecode
+sidecode_by_shape = np.full(64, "", dtype="U6")
+for pattern in sidecodes:
+    sidecode_by_shape[shape_id(pattern)] = pattern
+
+
+def classify_plate(plate):
+    """Return the sidecode of a plate, "" if it is not in a known sidecode."""
+    code = encode_plate(plate)
+    if code is None:
+        return ""
+    return str(sidecode_by_shape[code >> SHAPE_BITS])
+
+
+def classify_many(plates):
+    """
+    Return the sidecode of every plate of a batch, like classify_plate.
+
+    Args:
+        plates (list): Plates of up to 8 characters, without dashes.
+
+    Returns:
+        list: Sidecode names in the same order, "" for unknown plates.
+    """
+    if not len(plates):
+        return []
+    # One row of unicode code points per plate
+    codes = np.asarray(plates, dtype="U8").view(np.uint32).reshape(len(plates), 8)
+    letters = (codes >= ord("A")) & (codes <= ord("Z"))
+    digits = (codes >= ord("0")) & (codes <= ord("9"))
+    valid = (letters | digits)[:, :6].all(axis=1) & (codes[:, 6:] == 0).all(axis=1)
+    shapes = letters[:, :6] @ (1 << np.arange(5, -1, -1))
+    return np.where(valid, sidecode_by_shape[shapes], "").tolist()
@@ -1,11 +1,46 @@
+PLATES = (
+    "01DBBH",
+    "77JBB1",
+    "74NTX9",
+    "17PJGL",
+    "01DBFJ",
+    "01DSHS",
+    "01DBVL",
+    "94BBX8",
+    "09WSND",
+)
+
+
 def generate_license_plates_test():
     """Generate license plates with the AA0000 pattern."""
-    yield "01DBBH"
-    yield "77JBB1"
-    yield "74NTX9"
-    yield "17PJGL"
-    yield "01DBFJ"
-    yield "01DSHS"
-    yield "01DBVL"
-    yield "94BBX8"
-    yield "09WSND"
+    for plate in PLATES:
+        yield plate
+
+
+def size():
+    """Return the number of test plates."""
+    return len(PLATES)
+
+
+def rank(plate):
+    """Return the index of a test plate, raises ValueError if unknown."""
+    return PLATES.index(plate)
+
+
+def unrank(index):
+    """Return the test plate at the given index."""
+    if index < 0:
+        raise IndexError(f"Index {index} is outside of the test plates")
+    return PLATES[index]
+
+
+def iter_keyed(index=0, stop=None):
+    """Yield (index, test plate) pairs from an index up to stop (excluded)."""
+    for position, plate in enumerate(PLATES[index:stop], start=index):
+        yield position, plate
+
+
+def iter_from(index=0):
+    """Yield the test plates starting at the given index."""
+    for plate in PLATES[index:]:
+        yield plate
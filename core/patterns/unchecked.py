@@ -1,9 +1,14 @@
 from core.models import UncheckedPlates
+from core.patterns.db_source import KeyedQuerysetSource
+from core.patterns.issued import HIGH_PRIORITY
 
 
-def generate_license_plates_unchecked():
+def get_queryset():
     """
-    Generator to yield unchecked license plates.
+    Unchecked plates ordered by primary key so every index is stable.
+    High priority plates are left to the ISSUED source.
     """
-    for plate in UncheckedPlates.objects.values_list("plate", flat=True):
-        yield plate
+    return UncheckedPlates.objects.filter(priority__lt=HIGH_PRIORITY).order_by("id")
+
+
+source = KeyedQuerysetSource(get_queryset, "plate")
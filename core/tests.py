@@ -1,3 +1,277 @@
+# Python imports
+import io
+import json
+import threading
+from contextlib import redirect_stdout
+from datetime import date
+
+# Django Imports
 from django.test import TestCase
 
-# Create your tests here.
+# Selenium Imports
+from selenium.common.exceptions import WebDriverException
+
+from core.fetch.base import FALLBACK_WINDOW, FallbackBackend, FetchBackend
+from core.fetch.http_backend import (
+    BODY_DATASET,
+    FUEL_DATASET,
+    VEHICLES_DATASET,
+    HttpBackend,
+)
+from core.fetch.network_backend import (
+    RECORDING_PATH,
+    NetworkBackend,
+    payload_record,
+    response_dataset,
+)
+from core.fetch.stub_server import make_stub_server
+from core.utilities.scan_result import HIT, MISS, ERROR
+from vehicles.models import Make, Model
+
+# Record of the ZZ99ZZ rows in core/fetch/stub_fixtures.json, which the
+# OVI recording replays too
+ZZ99ZZ_RECORD = {
+    "make_raw": "Volkswagen",
+    "model_raw": "Golf",
+    "color": "GRIJS",
+    "category_raw": "Personenauto (M1)",
+    "body_type_raw": "Hatchback (AB)",
+    "first_reg": date(2019, 3, 15),
+    "first_reg_in_NL": date(2019, 3, 15),
+    "apk": date(2027, 3, 15),
+    "curb_weight": "1.340 kg",
+    "empty_weight": "1.240 kg",
+    "max_weight_tech": "1.810 kg",
+    "max_weight_legal": "1.810 kg",
+    "gross_combination_weight": "3.210 kg",
+    "trailer_with_brakes": "1.400 kg",
+    "trailer_without_brakes": "670 kg",
+    "exported": False,
+    "insurance": True,
+    "engine_volume": "1.498 cc",
+    "cylinder_count": "4",
+    "fuel_list": ["Benzine"],
+    "kw": "110 kW",
+    "kw2": None,
+}
+
+
+class HttpBackendTests(TestCase):
+    """Lookups against the stand-in server of core/fetch/stub_server.py."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Port 0 lets the OS pick a free port
+        cls.server = make_stub_server(0)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever)
+        cls.server_thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.server_thread.join()
+        super().tearDownClass()
+
+    def fetch(self, plate, profile="full", base_url=None):
+        backend = HttpBackend(profile, base_url=base_url or self.base_url, timeout=2)
+        backend.open()
+        try:
+            with redirect_stdout(io.StringIO()):
+                return backend.fetch(plate)
+        finally:
+            backend.close()
+
+    def test_hit_maps_open_data_fields(self):
+        self.assertEqual(self.fetch("ZZ99ZZ"), (HIT, ZZ99ZZ_RECORD))
+
+    def test_open_data_lacks_imported_in_nl(self):
+        # Left out so the save step keeps the value an OVI lookup stored
+        result, record = self.fetch("ZZ99ZZ")
+        self.assertNotIn("imported_in_NL", record)
+
+    def test_known_make_and_model_spelling_is_reused(self):
+        make = Make.objects.create(display_name="Volkswagen", raw_make="VolksWagen")
+        Model.objects.create(make=make, display_name="Golf", raw_model="GOLF gti")
+        Model.objects.create(make=make, display_name="Golf", raw_model="golf")
+        result, record = self.fetch("ZZ99ZZ")
+        self.assertEqual(
+            (record["make_raw"], record["model_raw"]), ("VolksWagen", "golf")
+        )
+
+    def test_profile_limits_fields(self):
+        result, record = self.fetch("ZZ99ZZ", profile="apk")
+        self.assertEqual(result, HIT)
+        self.assertEqual(record["apk"], date(2027, 3, 15))
+        self.assertNotIn("fuel_list", record)
+
+    def test_unknown_plate_is_miss(self):
+        self.assertEqual(self.fetch("XX00XX"), (MISS, None))
+
+    def test_http_error_status_is_error(self):
+        self.assertEqual(self.fetch("ZZ00ZZ"), (ERROR, None))
+
+    def test_unreachable_server_is_error(self):
+        # Nothing listens on the port of a closed server
+        server = make_stub_server(0)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        server.server_close()
+        self.assertEqual(self.fetch("ZZ99ZZ", base_url=base_url), (ERROR, None))
+
+
+class ReplayDriver:
+    """
+    Stand-in for the Chrome driver that replays a recorded lookup.
+
+    The log is handed out a few entries per get_log() call once the search
+    started, and a body is only available after its loadingFinished entry
+    was handed out, as in Chrome.
+    """
+
+    def __init__(self, recording, batch=8):
+        self.log = list(recording["log"])
+        self.bodies = recording["bodies"]
+        self.batch = batch
+        self.searched = False
+        self.finished = set()
+
+    def get_log(self, log_type):
+        if not self.searched:
+            return []
+        entries, self.log = self.log[: self.batch], self.log[self.batch :]
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Network.loadingFinished":
+                self.finished.add(message["params"]["requestId"])
+        return entries
+
+    def execute_cdp_cmd(self, cmd, params):
+        request_id = params["requestId"]
+        if request_id not in self.finished or request_id not in self.bodies:
+            raise WebDriverException("No resource with given identifier found")
+        return {"body": self.bodies[request_id], "base64Encoded": False}
+
+
+class NetworkBackendTests(TestCase):
+    def setUp(self):
+        with open(RECORDING_PATH) as f:
+            self.recording = json.load(f)
+        self.plate = self.recording["plate"]
+
+    def urls(self):
+        """URLs of the recorded responses by request id."""
+        urls = {}
+        for entry in self.recording["log"]:
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Network.responseReceived":
+                urls[message["params"]["requestId"]] = message["params"]["response"][
+                    "url"
+                ]
+        return urls
+
+    def scrape(self, timeout=5):
+        backend = NetworkBackend(timeout=timeout)
+        driver = ReplayDriver(self.recording)
+        backend.driver = driver
+
+        def search(plate):
+            driver.searched = True
+
+        backend.search = search
+        with redirect_stdout(io.StringIO()):
+            return backend.scrape(self.plate)
+
+    def test_response_dataset_matches_recorded_urls(self):
+        datasets = {
+            response_dataset(url, self.plate) for url in self.urls().values()
+        } - {None}
+        self.assertEqual(datasets, {VEHICLES_DATASET, FUEL_DATASET, BODY_DATASET})
+
+    def test_response_dataset(self):
+        api = "https://ovi.rdw.nl/api"
+        self.assertEqual(
+            response_dataset(f"{api}/m9d7-ebf2.json?kenteken=ZZ99ZZ", "ZZ99ZZ"),
+            VEHICLES_DATASET,
+        )
+        self.assertEqual(
+            response_dataset(f"{api}/8ys7-d773.json?kenteken=zz-99-zz", "ZZ99ZZ"),
+            FUEL_DATASET,
+        )
+        # Other plates, other API calls and non-API requests are ignored
+        self.assertIsNone(
+            response_dataset(f"{api}/m9d7-ebf2.json?kenteken=XX00XX", "ZZ99ZZ")
+        )
+        self.assertIsNone(response_dataset(f"{api}/config.json", "ZZ99ZZ"))
+        self.assertIsNone(
+            response_dataset(
+                "https://ovi.rdw.nl/m9d7-ebf2.json?kenteken=ZZ99ZZ", "ZZ99ZZ"
+            )
+        )
+
+    def test_payload_record_maps_recorded_bodies(self):
+        urls = self.urls()
+        payloads = [
+            json.loads(body)
+            for request_id, body in self.recording["bodies"].items()
+            if response_dataset(urls[request_id], self.plate)
+        ]
+        self.assertEqual(payload_record(payloads), ZZ99ZZ_RECORD)
+
+    def test_payload_record_finds_nested_rows(self):
+        record = payload_record(
+            [{"data": {"voertuig": [{"merk": "BMW", "handelsbenaming": "X5"}]}}]
+        )
+        self.assertEqual((record["make_raw"], record["model_raw"]), ("Bmw", "X5"))
+        self.assertIsNone(payload_record([[], {"brandstof_omschrijving": "Diesel"}]))
+
+    def test_scrape_replays_recording(self):
+        self.assertEqual(self.scrape(), (HIT, ZZ99ZZ_RECORD))
+
+    def test_scrape_empty_vehicle_response_is_miss(self):
+        for request_id, url in self.urls().items():
+            if response_dataset(url, self.plate) == VEHICLES_DATASET:
+                self.recording["bodies"][request_id] = "[]"
+        self.assertEqual(self.scrape(), (MISS, None))
+
+    def test_scrape_missing_response_is_error(self):
+        for request_id, url in self.urls().items():
+            if response_dataset(url, self.plate) == FUEL_DATASET:
+                del self.recording["bodies"][request_id]
+        self.assertEqual(self.scrape(timeout=1), (ERROR, None))
+
+
+class StaticBackend(FetchBackend):
+    """Backend returning the same result for every plate."""
+
+    def __init__(self, name, result):
+        self.name = name
+        self.result = result
+
+    def fetch(self, plate):
+        return self.result, None
+
+
+class FallbackBackendTests(TestCase):
+    def run_lookups(self, primary_result, lookups):
+        backend = FallbackBackend(
+            StaticBackend("http", primary_result), StaticBackend("selenium", HIT)
+        )
+        output = io.StringIO()
+        with redirect_stdout(output):
+            for _ in range(lookups):
+                backend.fetch("ZZ99ZZ")
+        return output.getvalue()
+
+    def test_warns_when_most_lookups_fall_back(self):
+        output = self.run_lookups(ERROR, FALLBACK_WINDOW)
+        self.assertEqual(output.count("lookups fell back from http"), 1)
+
+    def test_no_warning_before_a_full_window(self):
+        output = self.run_lookups(ERROR, FALLBACK_WINDOW - 1)
+        self.assertNotIn("lookups fell back", output)
+
+    def test_no_warning_when_primary_works(self):
+        output = self.run_lookups(HIT, FALLBACK_WINDOW * 2)
+        self.assertNotIn("lookups fell back", output)
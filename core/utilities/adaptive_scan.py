@@ -0,0 +1,86 @@
+import numpy as np
+
+from core.utilities.scan_result import HIT, MISS
+from core.utilities.scan_state import BLOCK_SIZE, STATES, UNCHECKED
+
+
+def get_block_estimates(state_map):
+    """
+    Return the hit density estimate and sample size of every block.
+
+    The estimates are the hit rate of the plates checked so far in every
+    block, read back from the scan state, so every run starts from what the
+    previous runs found.
+
+    Returns:
+        tuple: (density, sampled) arrays, density is NaN for blocks without
+        a hit or miss yet.
+    """
+    counts = state_map.block_counts()
+    hits = counts[:, STATES[HIT]]
+    sampled = hits + counts[:, STATES[MISS]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        density = hits / sampled
+    return density, sampled
+
+
+def adaptive_offsets(state_map, start=0, stop=None, probes=16):
+    """
+    Yield unchecked offsets, probing every block before scanning dense ones.
+
+    Args:
+        state_map (ScanStateMap): Scan state of the pattern.
+        start (int): First offset to visit.
+        stop (int): Offset to stop at (excluded), the end of the pattern if None.
+        probes (int): Evenly spaced plates checked in every block before its
+            density is trusted.
+
+    Every block first gets `probes` plates checked. Blocks are then scanned
+    plate by plate from the highest estimated density down, blocks without
+    a single hit in their sample are parked and never scanned densely.
+    """
+    stop = state_map.size if stop is None else min(stop, state_map.size)
+    if start >= stop:
+        return
+    first_block, last_block = start // BLOCK_SIZE, (stop - 1) // BLOCK_SIZE
+
+    # Probe phase: a sparse sample of every block not sampled enough yet
+    density, sampled = get_block_estimates(state_map)
+    for block in np.flatnonzero(sampled < probes).tolist():
+        if not first_block <= block <= last_block:
+            continue
+        base = block * BLOCK_SIZE
+        end = min(base + BLOCK_SIZE, state_map.size)
+        stride = max((end - base) // probes, 1)
+        for offset in range(base + stride // 2, end, stride):
+            if start <= offset < stop and state_map.get(offset) == UNCHECKED:
+                yield offset
+
+    # Dense phase: productive blocks first, parked blocks are left out
+    density, sampled = get_block_estimates(state_map)
+    blocks = np.arange(first_block, last_block + 1)
+    blocks = blocks[density[blocks] > 0]
+    for block in blocks[np.argsort(-density[blocks], kind="stable")].tolist():
+        base = max(block * BLOCK_SIZE, start)
+        states = state_map.read(base, min((block + 1) * BLOCK_SIZE, stop))
+        for index in np.flatnonzero(states == UNCHECKED).tolist():
+            # Another worker may have checked it in the meantime
+            if state_map.get(base + index) == UNCHECKED:
+                yield base + index
+
+
+def adaptive_plates(source, state_map, start=0, stop=None, probes=16):
+    """Yield (offset, plate) pairs in adaptive order, see adaptive_offsets."""
+    for offset in adaptive_offsets(state_map, start, stop, probes):
+        yield offset, source.unrank(offset)
+
+
+def describe_estimates(state_map, start=0, stop=None, probes=16):
+    """Return (probed, dense, parked) block counts between two offsets."""
+    stop = state_map.size if stop is None else min(stop, state_map.size)
+    density, sampled = get_block_estimates(state_map)
+    blocks = slice(start // BLOCK_SIZE, max(stop - 1, start) // BLOCK_SIZE + 1)
+    probed = sampled[blocks] >= probes
+    dense = int(np.count_nonzero(probed & (density[blocks] > 0)))
+    parked = int(np.count_nonzero(probed & (density[blocks] == 0)))
+    return int(np.count_nonzero(probed)), dense, parked
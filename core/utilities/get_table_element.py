@@ -23,3 +23,42 @@ def get_element_text_by_label(driver, search_text):
     except NoSuchElementException:
         print(f"Element with label '{search_text}' not found.")
         return None
+
+
+# Collects the text of every <dt> and the <dd> that follows it in one call
+LABELS_SCRIPT = """
+const labels = [];
+for (const dt of document.querySelectorAll("dt")) {
+    let dd = dt.nextElementSibling;
+    while (dd && dd.tagName !== "DD" && dd.tagName !== "DT") {
+        dd = dd.nextElementSibling;
+    }
+    if (dd && dd.tagName === "DD") {
+        labels.push([dt.textContent.trim(), (dd.innerText || dd.textContent).trim()]);
+    }
+}
+return labels;
+"""
+
+
+def get_labels(driver):
+    """
+    Retrieve the text of every labelled element on the page at once.
+
+    Args:
+        driver: Selenium WebDriver instance.
+
+    Returns:
+        dict: Every label (e.g., "Kleur") with the texts associated with it,
+        in page order, as labels like "Brandstof" can occur more than once.
+    """
+    labels = {}
+    for label, text in driver.execute_script(LABELS_SCRIPT):
+        labels.setdefault(label, []).append(text)
+    return labels
+
+
+def get_label(labels, label, index=0):
+    """Return a text from get_labels, None if the label is not on the page."""
+    texts = labels.get(label, [])
+    return texts[index] if -len(texts) <= index < len(texts) else None
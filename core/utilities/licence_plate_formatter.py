@@ -1,21 +1,40 @@
-import re
+from functools import lru_cache
 
 # Terminal color import
 from colorama import Fore, Style
 
+# Dash positions of every known pattern, X is a letter and 9 a digit
 plate_format_rules = {
-    r"([A-Z]{2})(\d{2})(\d{2})": r"\1-\2-\3",  # XX9999 -> XX-99-99
-    r"(\d{2})([A-Z]{2})(\d{2})": r"\1-\2-\3",  # 99XX99 -> 99-XX-99
-    r"(\d{2})([A-Z]{2})([A-Z]{2})": r"\1-\2-\3",  # 99XXXX -> 99-XX-XX
-    r"(\d{2})(\d{2})([A-Z]{2})": r"\1-\2-\3",  # 9999XX -> 99-99-XX
-    r"([A-Z]{2})(\d{2})([A-Z]{2})": r"\1-\2-\3",  # XX99XX -> XX-99-XX
-    r"(\d{2})([A-Z]{3})(\d{1})": r"\1-\2-\3",  # 99XXX9 -> 99-XXX-9
-    r"(\d{1})([A-Z]{3})(\d{2})": r"\1-\2-\3",  # 9XXX99 -> 9-XXX-99
-    r"([A-Z]{3})(\d{2})([A-Z]{1})": r"\1-\2-\3",  # XXX99X -> XXX-99-X
-    r"([A-Z]{1})(\d{3})([A-Z]{2})": r"\1-\2-\3",  # XXX99X -> X-999-XX
+    "XX9999": (2, 4),  # XX9999 -> XX-99-99
+    "99XX99": (2, 4),  # 99XX99 -> 99-XX-99
+    "99XXXX": (2, 4),  # 99XXXX -> 99-XX-XX
+    "9999XX": (2, 4),  # 9999XX -> 99-99-XX
+    "XX99XX": (2, 4),  # XX99XX -> XX-99-XX
+    "99XXX9": (2, 5),  # 99XXX9 -> 99-XXX-9
+    "9XXX99": (1, 4),  # 9XXX99 -> 9-XXX-99
+    "XXX99X": (3, 5),  # XXX99X -> XXX-99-X
+    "X999XX": (1, 4),  # X999XX -> X-999-XX
 }
 
+# Maps every letter to X and every digit to 9 in a single str.translate
+plate_shape_table = str.maketrans(
+    {
+        **{chr(code): "X" for code in range(ord("A"), ord("Z") + 1)},
+        **{chr(code): "9" for code in range(ord("0"), ord("9") + 1)},
+    }
+)
 
+
+def _format(plate):
+    """Format a plate without caching, None if no pattern matches."""
+    dashes = plate_format_rules.get(plate.translate(plate_shape_table))
+    if dashes is None:
+        return None
+    first, second = dashes
+    return f"{plate[:first]}-{plate[first:second]}-{plate[second:]}"
+
+
+@lru_cache(maxsize=65536)
 def format_license_plate(plate):
     """
     Format a raw license plate based on known patterns.
@@ -26,8 +45,25 @@ def format_license_plate(plate):
     Returns:
         str: The formatted license plate, or the original if no pattern matches.
     """
-    for pattern, replacement in plate_format_rules.items():
-        if re.fullmatch(pattern, plate):  # Match the full plate
-            return re.sub(pattern, replacement, plate)
-    print(f"{Fore.RED}Unknown format: {plate}{Style.RESET_ALL}")
-    return plate  # Return as-is if no pattern matches
+    formatted = _format(plate)
+    if formatted is None:
+        print(f"{Fore.RED}Unknown format: {plate}{Style.RESET_ALL}")
+        return plate  # Return as-is if no pattern matches
+    return formatted
+
+
+def format_many(plates):
+    """
+    Format a batch of raw license plates, e.g. one page of a queryset.
+
+    Args:
+        plates (iterable): The raw license plates.
+
+    Returns:
+        list: The formatted plates in the same order, unknown formats as-is.
+    """
+    formatted_plates = []
+    for plate in plates:
+        formatted = _format(plate)
+        formatted_plates.append(plate if formatted is None else formatted)
+    return formatted_plates
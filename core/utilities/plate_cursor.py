@@ -0,0 +1,198 @@
+# Terminal color import
+from colorama import Fore, Back, Style
+
+from core.models import LastPlatechecked
+from core.patterns.frontier import get_issued_frontier, get_scan_bound
+from core.patterns.ordering import OrderedSource
+from core.utilities.licence_plate_formatter import format_license_plate as formatted
+
+
+def parse_shard(shard, size):
+    """
+    Return the offsets covered by a shard of a pattern.
+
+    Args:
+        shard (str): "i/N" for the i-th of N equal slices (0-based),
+            "start:stop" for an explicit offset range (either side may be
+            omitted), or "" for the whole pattern.
+        size (int): Number of plates in the pattern.
+
+    Returns:
+        tuple: (start, stop) offsets, stop excluded.
+
+    Raises:
+        ValueError: If the shard is malformed.
+    """
+    if not shard:
+        return 0, size
+    try:
+        if "/" in shard:
+            index, count = (int(part) for part in shard.split("/"))
+            if count < 1 or not 0 <= index < count:
+                raise ValueError
+            return size * index // count, size * (index + 1) // count
+        if ":" in shard:
+            start, stop = shard.split(":")
+            start = int(start) if start else 0
+            stop = min(int(stop), size) if stop else size
+            if start < 0 or stop < start:
+                raise ValueError
+            return start, stop
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid shard '{shard}', use 'i/N' or 'start:stop'")
+
+
+def get_shard_range(source, pattern, shard="", order="ascending"):
+    """
+    Return the steps a shard covers, frozen when the shard is first assigned.
+
+    Shards split the issued range, which grows as plates are issued. A
+    shard keeps the range it started with so its cursor stays inside it,
+    only the shard running to the end follows the growing range.
+
+    Args:
+        source (OrderedSource): The scan source, see get_scan_source.
+        pattern (str): The pattern name the cursor is stored under.
+        shard (str): The shard, see parse_shard.
+        order (str): The scan order the cursor is stored under.
+
+    Returns:
+        tuple: (start, stop) steps, stop excluded.
+
+    Raises:
+        ValueError: If the shard is malformed.
+    """
+    start, stop = parse_shard(shard, source.stop())
+    if not shard:
+        return start, stop
+    cursor, created = LastPlatechecked.objects.get_or_create(
+        pattern=pattern, shard=shard, order=order, defaults={"plate": ""}
+    )
+    if cursor.shard_start is None:
+        # First assignment, or a cursor saved before ranges were kept
+        cursor.shard_start = start
+        cursor.shard_stop = stop if stop < source.stop() else None
+        cursor.save()
+    if cursor.shard_stop is None:
+        return cursor.shard_start, source.stop()
+    return cursor.shard_start, cursor.shard_stop
+
+
+def save_last_plate(plate, pattern, offset, shard="", order="ascending", anchor=None):
+    """Save the last checked plate and its offset in the pattern."""
+    last_plate, created = LastPlatechecked.objects.get_or_create(
+        pattern=pattern, shard=shard, order=order
+    )
+    last_plate.plate = plate
+    last_plate.offset = offset
+    last_plate.anchor = anchor
+    last_plate.save()
+    print(f"Saved last checked plate: {formatted(plate)} (offset {offset})")
+
+
+def get_cursor_anchor(pattern, order):
+    """
+    Return the anchor a frontier-first sweep was started from, if any.
+
+    All shards of a sweep share the anchor of the first cursor, delete the
+    cursors of the pattern to start a new sweep from the current frontier.
+    """
+    return (
+        LastPlatechecked.objects.filter(
+            pattern=pattern, order=order, anchor__isnull=False
+        )
+        .order_by("id")
+        .values_list("anchor", flat=True)
+        .first()
+    )
+
+
+def get_scan_source(
+    source, pattern, order="ascending", bound_margin=10000, verbose=True
+):
+    """
+    Wrap a plate source in the order and issued range a sweep walks.
+
+    Frontier-first orders stay anchored where the sweep started, and plates
+    past the issued range of the series are skipped (see get_scan_bound).
+
+    Returns:
+        tuple: (OrderedSource, order, anchor). The order falls back to
+        "ascending" when no issued plate of the pattern is known.
+    """
+    anchor = None
+    if order != "ascending":
+        anchor = get_cursor_anchor(pattern, order)
+        if anchor is None:
+            anchor = get_issued_frontier(pattern, source)
+        if anchor is None:
+            if verbose:
+                print(
+                    f"{Fore.RED}No issued plate known for pattern {pattern}, scanning in ascending order.{Style.RESET_ALL}"
+                )
+            order = "ascending"
+
+    # Plates past the issued range of the series cannot exist yet
+    bound = get_scan_bound(pattern, bound_margin)
+    if verbose and bound is not None and bound < source.size():
+        print(f"Pattern clipped after: {formatted(source.unrank(bound))}")
+
+    scan_source = OrderedSource(source, order, anchor or 0, bound)
+    if verbose and order != "ascending":
+        print(f"Order set to: {order} from {formatted(scan_source.unrank(0))}")
+    return scan_source, order, anchor
+
+
+def get_resume_index(source, pattern, shard="", start=0, order="ascending"):
+    """
+    Return the offset to resume a pattern (or one shard of it) from.
+
+    Args:
+        source: Plate source module exposing rank() and unrank().
+        pattern (str): The pattern name the cursor is stored under.
+        shard (str): The shard the cursor is stored under.
+        start (int): First offset of the shard.
+        order (str): The scan order the cursor is stored under.
+
+    Returns:
+        int: The offset of the first plate that still has to be checked.
+    """
+    last_plate = LastPlatechecked.objects.filter(
+        pattern=pattern, shard=shard, order=order
+    ).first()
+    if not last_plate or not last_plate.plate:
+        print("Starting from the beginning of the pattern.")
+        return start
+
+    print(
+        f"Resuming from plate after: {Fore.BLACK}{Back.YELLOW}{formatted(last_plate.plate)}{Style.RESET_ALL}"
+    )
+    # Only trust the stored offset while it still points at the stored plate
+    if last_plate.offset is not None:
+        try:
+            if source.unrank(last_plate.offset) == last_plate.plate:
+                return max(last_plate.offset + 1, start)
+        except IndexError:
+            pass
+
+    # Older cursors only have the plate, look up its offset
+    try:
+        return max(source.rank(last_plate.plate) + 1, start)
+    except ValueError:
+        print(
+            f"{Fore.RED}Plate {last_plate.plate} is not part of pattern {pattern}, starting from the beginning.{Style.RESET_ALL}"
+        )
+        return start
+
+
+def is_shard_done(source, pattern, shard, start, stop, order="ascending"):
+    """Return True once no plate is left between a shard cursor and its end."""
+    offset = (
+        LastPlatechecked.objects.filter(pattern=pattern, shard=shard, order=order)
+        .values_list("offset", flat=True)
+        .first()
+    )
+    if offset is not None:
+        start = max(offset + 1, start)
+    return next(source.iter_steps(start, stop), None) is None
@@ -0,0 +1,167 @@
+# Terminal color import
+from colorama import Fore, Style
+
+# Data Clearning and Utilities Imports
+from core.utilities.clean_data import clean_make, clean_model, clean_vehicle_category
+from core.utilities.licence_plate_formatter import format_license_plate as formatted
+
+# Custom models imports
+from vehicles.models import (
+    Vehicle,
+    Make,
+    Model,
+    Color,
+    FuelType,
+    VehicleCategory,
+    BodyType,
+)
+
+# Record fields stored on the Vehicle as they are
+VEHICLE_FIELDS = (
+    "first_reg",
+    "first_reg_in_NL",
+    "imported_in_NL",
+    "apk",
+    "engine_volume",
+    "cylinder_count",
+    "kw",
+    "kw2",
+    "exported",
+    "insurance",
+    "curb_weight",
+    "empty_weight",
+    "max_weight_tech",
+    "max_weight_legal",
+    "gross_combination_weight",
+    "trailer_with_brakes",
+    "trailer_without_brakes",
+)
+
+
+def save_vehicle(plate, record):
+    """
+    Save a vehicle record returned by a fetch backend.
+
+    Args:
+        plate (str): The licence plate the record belongs to.
+        record (dict): The fields listed in core.fetch.base.RECORD_FIELDS.
+
+    Returns:
+        Vehicle: The created or updated vehicle.
+    """
+    make_raw = record["make_raw"]
+    make = clean_make(make_raw)
+    model_raw = record["model_raw"]
+    model = clean_model(make, model_raw)
+    color = record["color"]
+    vehicle_category, category_code = clean_vehicle_category(record["category_raw"])
+    body_type, body_type_code = clean_vehicle_category(record["body_type_raw"])
+    fuel_list = record["fuel_list"]
+
+    # Print all data
+    print(
+        f"{Fore.GREEN}Licence Plate: {formatted(plate)}, Vehicle Category: {vehicle_category}, Make: {make}, Model: {model}, First Reg: {record.get('first_reg')}, APK: {record.get('apk')}{Style.RESET_ALL}"  # noqa
+    )
+
+    """
+    Save all data
+    """
+    # Create or update the VehicleCategory model
+    vehicle_category_instance, vehicle_category_created = (
+        VehicleCategory.objects.get_or_create(
+            code=category_code, defaults={"display_name": vehicle_category}
+        )
+    )
+    # Create or update the VehicleBodyType model
+    vehicle_body_type_instance, vehicle_body_type_created = (
+        BodyType.objects.get_or_create(
+            code=body_type_code, defaults={"display_name": body_type}
+        )
+    )
+    # Create or update the Make (Brand) model
+    make_instance, make_created = Make.objects.get_or_create(
+        vehicle_category=vehicle_category_instance,
+        display_name=make.title(),
+        raw_make=make_raw,
+    )
+    # Create or update the Model model
+    model_instance, model_created = Model.objects.get_or_create(
+        make=make_instance,
+        display_name=model,
+        raw_model=model_raw,
+    )
+    # Create or update the Color model
+    color_instance, color_created = Color.objects.get_or_create(
+        display_name=color.title() if color else "-"
+    )
+    # Create or update car instance, fields missing from the record keep
+    # their stored value
+    defaults = {
+        "make": make_instance,
+        "model": model_instance,
+        "vehicle_category": vehicle_category_instance,
+        "body_type": vehicle_body_type_instance,
+        "color": color_instance,
+    }
+    defaults.update(
+        {field: record[field] for field in VEHICLE_FIELDS if field in record}
+    )
+    vehicle_instance, vehicle_created = Vehicle.objects.update_or_create(
+        licence_plate=plate, defaults=defaults
+    )
+    undefined_fuel = FuelType.objects.get_or_create(
+        code="NA", display_name="Undefined"
+    )[0]
+    # Assign valid fuel types to the car
+    if fuel_list:
+        for fuel in fuel_list:
+            if fuel:  # Check if fuel is not None or empty
+                fuel_type = FuelType.objects.filter(display_name__iexact=fuel).first()
+                if not fuel_type:
+                    print(f"Fuel type '{fuel}' not found. Assigning Undefined.")
+                    fuel_type = undefined_fuel
+                vehicle_instance.fuel_type.add(fuel_type)
+                vehicle_instance.save()
+    else:
+        vehicle_instance.fuel_type.add(undefined_fuel)
+        vehicle_instance.save
+
+    if not vehicle_created:
+        vehicle_instance.save()
+
+    """
+    Print saved data
+    """
+    # Vehicle Category
+    if vehicle_category_created:
+        print(f"New Vehicle Category created: {vehicle_category_instance.display_name}")
+    else:
+        print(f"Vehicle Category retrieved: {vehicle_category_instance.display_name}")
+    # Body Type
+    if vehicle_body_type_created:
+        print(f"New Body Type created: {vehicle_body_type_instance.display_name}")
+    else:
+        print(f"Body Type retrieved: {vehicle_body_type_instance.display_name}")
+    # Make
+    if make_created:
+        print(f"New Make created: {make_instance.display_name}")
+    else:
+        print(f"Make retrieved: {make_instance.display_name}")
+    # Model
+    if model_created:
+        print(f"New Model created: {model_instance.display_name}")
+    else:
+        print(f"Model retrieved: {model_instance.display_name}")
+    # Color
+    if color_created:
+        print(f"New Color created: {color_instance.display_name}")
+    elif color_instance:
+        print(f"Color retrieved: {color_instance.display_name}")
+    else:
+        print("No color registered for this vehicle.")
+    # Vehicle
+    if vehicle_created:
+        print(f"New Vehicle created: {vehicle_instance.display_name}")
+    else:
+        print(f"Vehicle retrieved: {vehicle_instance.display_name}")
+    return vehicle_instance
@@ -0,0 +1,96 @@
+# Python imports
+from datetime import timedelta
+
+# Django Imports
+from django.db.models import F, Sum
+from django.utils.timezone import now
+
+from core.models import LastPlatechecked, ScanCounter
+from core.patterns.frontier import get_scan_bound
+from core.utilities.scan_result import HIT, MISS, ERROR
+from core.utilities.scan_state import STATES, get_state_map
+
+# Counter column of every scan result
+COUNTER_FIELDS = {HIT: "hits", MISS: "misses", ERROR: "errors"}
+
+
+def count_scan_result(pattern, result):
+    """Add one lookup result to the counter of the pattern for the current hour."""
+    field = COUNTER_FIELDS.get(result)
+    if field is None:
+        return
+    hour = now().replace(minute=0, second=0, microsecond=0)
+    counter, created = ScanCounter.objects.get_or_create(pattern=pattern, hour=hour)
+    # Several workers count into the same row, let the database add
+    ScanCounter.objects.filter(id=counter.id).update(**{field: F(field) + 1})
+
+
+def get_scan_coverage(pattern, source, hours=24, bound_margin=10000):
+    """
+    Return how far a pattern is scanned and when it will be done.
+
+    Args:
+        pattern (str): Pattern name as in pattern_to_source.
+        source: Plate source of the pattern.
+        hours (int): Number of recent hours the scan rate is measured over.
+        bound_margin (int): Margin used for the issued range, see get_scan_bound.
+
+    Returns:
+        dict: Keyspace size, the plates in the issued range, how many of
+        them are checked, the cursor of every shard and order, hit/miss/error
+        lookup totals, plates per hour and the projected completion time
+        (None while nothing is scanned).
+    """
+    size = source.size()
+    bound = get_scan_bound(pattern, bound_margin)
+    scan_size = size if bound is None else min(size, bound + 1)
+
+    counters = ScanCounter.objects.filter(pattern=pattern)
+    totals = counters.aggregate(
+        hits=Sum("hits"), misses=Sum("misses"), errors=Sum("errors")
+    )
+    hits, misses, errors = (totals[key] or 0 for key in ("hits", "misses", "errors"))
+    recent = counters.filter(hour__gte=now() - timedelta(hours=hours)).aggregate(
+        plates=Sum(F("hits") + F("misses") + F("errors"))
+    )
+    plates_per_hour = (recent["plates"] or 0) / hours
+
+    # Plates with a hit or miss in the scan state, every plate counts once
+    # however often it is rechecked and errors still have to be retried
+    state_map = get_state_map(pattern)
+    if state_map is not None:
+        counts = state_map.count_states(0, scan_size)
+        checked = int(counts[STATES[HIT]] + counts[STATES[MISS]])
+    else:
+        # No scan state outside the sidecodes, the counters are the best guess
+        checked = min(hits + misses, scan_size)
+
+    # Shards and orders keep cursors of their own
+    cursors = list(
+        LastPlatechecked.objects.filter(pattern=pattern)
+        .order_by("shard", "order")
+        .values("shard", "order", "offset", "plate")
+    )
+
+    remaining = max(scan_size - checked, 0)
+    eta = None
+    if plates_per_hour:
+        try:
+            eta = now() + timedelta(hours=remaining / plates_per_hour)
+        except OverflowError:
+            # Further away than a datetime can hold
+            eta = None
+
+    return {
+        "pattern": pattern,
+        "size": size,
+        "scan_size": scan_size,
+        "checked": checked,
+        "cursors": cursors,
+        "hits": hits,
+        "misses": misses,
+        "errors": errors,
+        "remaining": remaining,
+        "plates_per_hour": round(plates_per_hour, 1),
+        "eta": eta,
+    }
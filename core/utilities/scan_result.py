@@ -0,0 +1,4 @@
+# Outcome of a single plate lookup
+HIT = "hit"  # Vehicle data found and saved
+MISS = "miss"  # "Er zijn geen voertuiggegevens gevonden"
+ERROR = "error"  # Unexpected page, plate added to UncheckedPlates
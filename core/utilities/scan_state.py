@@ -0,0 +1,203 @@
+# Python imports
+import os
+import time as t
+
+import numpy as np
+
+# Django Imports
+from django.conf import settings
+
+from core.patterns.frontier import record_hit
+from core.patterns.sidecodes import RULES_VERSION, plate_pattern, sidecodes
+from core.utilities.scan_result import HIT, MISS, ERROR
+
+# State of every plate
+UNCHECKED = 0
+STATES = {HIT: 1, MISS: 2, ERROR: 3}
+
+# Plates per block for timestamps and density estimates
+BLOCK_SIZE = 4096
+
+# Plates read at once when scanning the state array
+SCAN_WINDOW = 1 << 20
+
+
+class ScanStateMap:
+    """
+    Memory-mapped scan state of every plate of one pattern.
+
+    Every plate takes a byte, indexed by its rank in the sidecode:
+    unchecked, hit, miss or error. A byte of its own lets shards of any
+    order write neighbouring plates without a lock. A second array keeps
+    the last time (epoch seconds) every block of BLOCK_SIZE plates was
+    written, so age based queries work per block. Both files live in
+    settings.SCAN_STATE_DIR and are shared by every process scanning the
+    pattern.
+    """
+
+    def __init__(self, pattern, size, directory=None):
+        self.pattern = pattern
+        self.size = size
+        self.block_count = -(-size // BLOCK_SIZE)
+        directory = directory or settings.SCAN_STATE_DIR
+        os.makedirs(directory, exist_ok=True)
+
+        path = os.path.join(directory, f"{pattern}.states")
+        if not os.path.exists(path):
+            self._convert_packed(os.path.join(directory, f"{pattern}.state"), path)
+        self.states = self._open(path, np.uint8, size)
+        self.checked_at = self._open(
+            os.path.join(directory, f"{pattern}.blocks"), np.uint32, self.block_count
+        )
+
+    def _open(self, path, dtype, length):
+        """Open (or create zero-filled) a memory-mapped array file."""
+        nbytes = length * np.dtype(dtype).itemsize
+        if not os.path.exists(path) or os.path.getsize(path) < nbytes:
+            with open(path, "ab") as file:
+                file.truncate(nbytes)
+        return np.memmap(path, dtype=dtype, mode="r+", shape=(length,))
+
+    def _convert_packed(self, packed_path, path):
+        """Carry over a state file with 2 bits per plate, the earlier format."""
+        if not os.path.exists(packed_path):
+            return
+        packed = np.fromfile(packed_path, dtype=np.uint8)
+        states = (packed[:, None] >> np.array([0, 2, 4, 6], dtype=np.uint8)) & 3
+        states.ravel()[: self.size].tofile(path + ".tmp")
+        os.replace(path + ".tmp", path)
+        os.remove(packed_path)
+
+    def get(self, index):
+        """Return the state of the plate at an index."""
+        return int(self.states[index])
+
+    def set(self, index, state, when=None):
+        """Store the state of the plate at an index."""
+        self.states[index] = state
+        self.checked_at[index // BLOCK_SIZE] = int(when or t.time())
+
+    def read(self, start=0, stop=None):
+        """Return the states between two indexes as an array of uint8."""
+        stop = self.size if stop is None else min(stop, self.size)
+        if start >= stop:
+            return np.zeros(0, dtype=np.uint8)
+        return np.asarray(self.states[start:stop])
+
+    def next_unchecked(self, start=0):
+        """Return the first unchecked index at or after start, or None."""
+        for window_start in range(start, self.size, SCAN_WINDOW):
+            states = self.read(window_start, window_start + SCAN_WINDOW)
+            unchecked = np.flatnonzero(states == UNCHECKED)
+            if len(unchecked):
+                return window_start + int(unchecked[0])
+        return None
+
+    def last_checked(self):
+        """Return the highest index with a stored state, or None."""
+        for window_stop in range(self.size, 0, -SCAN_WINDOW):
+            window_start = max(window_stop - SCAN_WINDOW, 0)
+            checked = np.flatnonzero(self.read(window_start, window_stop))
+            if len(checked):
+                return window_start + int(checked[-1])
+        return None
+
+    def misses_older_than(self, timestamp):
+        """Yield the indexes of misses in blocks last written before a timestamp."""
+        checked_at = np.asarray(self.checked_at)
+        blocks = np.flatnonzero((checked_at > 0) & (checked_at < timestamp))
+        for block in blocks.tolist():
+            start = block * BLOCK_SIZE
+            states = self.read(start, start + BLOCK_SIZE)
+            for index in np.flatnonzero(states == STATES[MISS]).tolist():
+                yield start + index
+
+    def block_counts(self):
+        """
+        Return per-block counts of every state.
+
+        Returns:
+            numpy.ndarray: Shape (blocks, 4), columns indexed by state.
+        """
+        counts = np.zeros((self.block_count, 4), dtype=np.int64)
+        for window_start in range(0, self.size, SCAN_WINDOW):
+            states = self.read(window_start, window_start + SCAN_WINDOW)
+            # Pad the last block with a value that is not a state
+            padded = np.full(-(-len(states) // BLOCK_SIZE) * BLOCK_SIZE, 4, np.uint8)
+            padded[: len(states)] = states
+            blocks = padded.reshape(-1, BLOCK_SIZE)
+            first = window_start // BLOCK_SIZE
+            for state in range(4):
+                counts[first : first + len(blocks), state] = (blocks == state).sum(
+                    axis=1
+                )
+        return counts
+
+    def count_states(self, start=0, stop=None):
+        """Return the number of plates in every state between two indexes."""
+        stop = self.size if stop is None else min(stop, self.size)
+        counts = np.zeros(4, dtype=np.int64)
+        for window_start in range(start, stop, SCAN_WINDOW):
+            states = self.read(window_start, min(window_start + SCAN_WINDOW, stop))
+            counts += np.bincount(states, minlength=4)
+        return counts
+
+    def hit_density(self):
+        """Return hits / checked plates per block, NaN for unchecked blocks."""
+        counts = self.block_counts()
+        checked = counts[:, 1:].sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return counts[:, STATES[HIT]] / checked
+
+    def flush(self):
+        """Write pending changes to disk."""
+        self.states.flush()
+        self.checked_at.flush()
+
+
+_state_maps = {}
+
+
+def get_state_map(pattern):
+    """Return the (cached) scan state of a sidecode, None for other patterns."""
+    sidecode = sidecodes.get(pattern)
+    if sidecode is None:
+        return None
+    if pattern not in _state_maps:
+        # Offsets move when the exclusion rules change, keep a state per version
+        _state_maps[pattern] = ScanStateMap(
+            f"{pattern}.v{RULES_VERSION}", sidecode.size()
+        )
+    return _state_maps[pattern]
+
+
+def get_plate_state(plate):
+    """Return the stored state of a plate, None if it is not in a sidecode."""
+    pattern = plate_pattern(plate)
+    state_map = get_state_map(pattern)
+    if state_map is None:
+        return None
+    try:
+        return state_map.get(sidecodes[pattern].rank(plate))
+    except ValueError:
+        return None
+
+
+def record_scan_result(plate, result):
+    """Store the outcome of a lookup in the scan state of its sidecode."""
+    if result == HIT:
+        record_hit(plate)
+    pattern = plate_pattern(plate)
+    state_map = get_state_map(pattern)
+    if state_map is None or result not in STATES:
+        return
+    try:
+        state_map.set(sidecodes[pattern].rank(plate), STATES[result])
+    except ValueError:
+        return
+
+
+def flush_state_maps():
+    """Write the scan states opened by this process to disk."""
+    for state_map in _state_maps.values():
+        state_map.flush()
@@ -0,0 +1,94 @@
+# Python imports
+import bisect
+import threading
+import time as t
+from contextlib import contextmanager
+
+# Upper bounds in seconds of the histogram buckets, the last one is open
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class LatencyHistogram:
+    """Counts the durations of one scraper step per latency bucket."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.slowest = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.slowest = max(self.slowest, seconds)
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q quantile, None if empty."""
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS + (self.slowest,), self.counts):
+            seen += count
+            if count and seen >= target:
+                return bound
+        return None
+
+
+# Histograms by step name, kept for the lifetime of the process
+step_latencies = {}
+# Lookups run in several threads at once, see core/fetch/pool.py
+step_latencies_lock = threading.Lock()
+
+
+def record_step(step, seconds):
+    """Add the duration of one step to its histogram."""
+    with step_latencies_lock:
+        step_latencies.setdefault(step, LatencyHistogram()).add(seconds)
+
+
+@contextmanager
+def timed_step(step):
+    """Record how long the block takes as one run of the step."""
+    start_time = t.perf_counter()
+    try:
+        yield
+    finally:
+        record_step(step, t.perf_counter() - start_time)
+
+
+def describe_step_latencies():
+    """
+    Summarize the recorded steps.
+
+    Returns:
+        list: Per step, a dict with the number of runs, the mean and slowest
+        duration, the bucket bounds of the median and 95th percentile and
+        the count of every bucket.
+    """
+    summary = []
+    for step, histogram in sorted(step_latencies.items()):
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS]
+        labels.append(f">{LATENCY_BUCKETS[-1]}s")
+        summary.append(
+            {
+                "step": step,
+                "count": histogram.count,
+                "mean": histogram.total / histogram.count,
+                "slowest": histogram.slowest,
+                "p50": histogram.quantile(0.5),
+                "p95": histogram.quantile(0.95),
+                "buckets": dict(zip(labels, histogram.counts)),
+            }
+        )
+    return summary
+
+
+def print_step_latencies():
+    """Print the latency summary of every recorded step."""
+    for row in describe_step_latencies():
+        print(
+            f"{row['step']:<20} {row['count']:>6} runs  mean {row['mean']:.2f}s  "
+            f"p50 <={row['p50']:.2f}s  p95 <={row['p95']:.2f}s  slowest {row['slowest']:.2f}s"
+        )
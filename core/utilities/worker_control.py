@@ -0,0 +1,120 @@
+"""
+Control of long-running scraper workers (--daemon): a clean stop on
+SIGTERM and a heartbeat file monitoring can watch.
+"""
+
+# Python imports
+import json
+import os
+import signal
+import socket
+import threading
+from datetime import datetime
+
+# Django Imports
+from django.conf import settings
+
+# Signals asking a worker to stop, SIGBREAK is Ctrl+Break on Windows
+STOP_SIGNALS = [
+    getattr(signal, name)
+    for name in ("SIGTERM", "SIGINT", "SIGBREAK")
+    if hasattr(signal, name)
+]
+
+
+class GracefulStop:
+    """
+    Turn stop signals into a flag the worker checks between plates.
+
+    The first signal lets the current plates finish and checkpoints be
+    written, a second one stops the process right away.
+    """
+
+    def __init__(self, on_stop=None):
+        self.event = threading.Event()
+        self.on_stop = on_stop
+        self.previous_handlers = {}
+
+    @property
+    def requested(self):
+        return self.event.is_set()
+
+    def install(self):
+        for signum in STOP_SIGNALS:
+            self.previous_handlers[signum] = signal.signal(signum, self.handle)
+
+    def restore(self):
+        for signum, handler in self.previous_handlers.items():
+            signal.signal(signum, handler)
+        self.previous_handlers = {}
+
+    def handle(self, signum, frame):
+        if self.requested:
+            raise KeyboardInterrupt
+        print(
+            f"Received {signal.Signals(signum).name}, finishing the current plates..."
+        )
+        self.event.set()
+        if self.on_stop:
+            self.on_stop()
+
+    def wait(self, seconds):
+        """Sleep, returns True as soon as a stop is requested."""
+        return self.event.wait(seconds)
+
+
+class Heartbeat:
+    """
+    Write the status of a worker to a JSON file at most every `interval`
+    seconds, monitoring treats a worker whose file stops updating as stuck.
+    """
+
+    def __init__(self, name, interval=30):
+        self.path = os.path.join(
+            settings.WORKER_HEARTBEAT_DIR, f"{socket.gethostname()}-{name}.json"
+        )
+        self.interval = interval
+        self.started = datetime.now()
+        self.last_beat = None
+        self.status = {}
+
+    def beat(self, force=False, **status):
+        """Update the status, written when forced or the interval passed."""
+        self.status.update(status)
+        current_time = datetime.now()
+        if (
+            not force
+            and self.last_beat
+            and (current_time - self.last_beat).total_seconds() < self.interval
+        ):
+            return
+        self.last_beat = current_time
+        data = {
+            "worker": os.path.basename(self.path).removesuffix(".json"),
+            "pid": os.getpid(),
+            "started": self.started.isoformat(),
+            "updated": current_time.isoformat(),
+            **self.status,
+        }
+        os.makedirs(settings.WORKER_HEARTBEAT_DIR, exist_ok=True)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, default=str)
+        os.replace(temporary_path, self.path)
+
+
+def get_heartbeats():
+    """Return the last heartbeat of every worker, oldest first."""
+    directory = settings.WORKER_HEARTBEAT_DIR
+    if not os.path.isdir(directory):
+        return []
+    heartbeats = []
+    for name in os.listdir(directory):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as file:
+                heartbeats.append(json.load(file))
+        except (OSError, ValueError):
+            continue
+    return sorted(heartbeats, key=lambda heartbeat: heartbeat["started"])
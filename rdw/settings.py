@@ -153,6 +153,33 @@ STATICFILES_DIRS = (os.path.join(BASE_DIR, "static"),)
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Memory-mapped per-pattern scan state (see core/utilities/scan_state.py)
+SCAN_STATE_DIR = os.path.join(BASE_DIR, "scan_state")
+
+# Recycling of long-running browser sessions (see core/fetch/supervisor.py)
+SESSION_METRICS_DIR = os.path.join(BASE_DIR, "session_metrics")
+SESSION_MAX_PAGES = 500
+SESSION_MAX_REFRESHES = 5
+SESSION_MAX_HEAP_MB = 512
+SESSION_LATENCY_FACTOR = 2.0
+
+# Heartbeat files of scraper commands running with --daemon
+WORKER_HEARTBEAT_DIR = os.path.join(BASE_DIR, "worker_heartbeats")
+
+# Chrome profile of the scraper browsers (see core/fetch/browser_profiles.py)
+BROWSER_PROFILE = os.environ.get("BROWSER_PROFILE", "default")
+BROWSER_CACHE_DIR = os.path.join(BASE_DIR, "browser_cache")
+
+# Fetch backend of get_vehicles: "selenium", "network" or "http" (the last two
+# fall back to selenium)
+FETCH_BACKEND = os.environ.get("FETCH_BACKEND", "selenium")
+# Warn when more than this share of recent lookups needs the fallback backend
+FETCH_FALLBACK_WARN_RATE = 0.5
+RDW_OPEN_DATA_URL = os.environ.get(
+    "RDW_OPEN_DATA_URL", "https://opendata.rdw.nl/resource"
+)
+RDW_APP_TOKEN = os.environ.get("RDW_APP_TOKEN", "")
+
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
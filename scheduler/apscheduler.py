@@ -5,6 +5,8 @@ from django.core.management import call_command
 
 def get_latest_plate():
     call_command("get_latest_plate")
+    # Queue everything issued since the previous snapshot
+    call_command("enqueue_issued_plates")
 
 
 def start():
@@ -13,6 +13,8 @@ from core.models import (
     UncheckedPlates,
     LastPlatechecked,
     RecheckForAPKPlates,
+    PatternProgress,
+    ScanCounter,
 )
 
 
@@ -189,6 +191,10 @@ class LastPlatecheckedAdmin(admin.ModelAdmin):
     list_display = (
         "plate",
         "pattern",
+        "shard",
+        "order",
+        "anchor",
+        "offset",
     )
 
 
@@ -213,6 +219,24 @@ class RecheckForAPKPlatesAdmin(admin.ModelAdmin):
     )
 
 
+class PatternProgressAdmin(admin.ModelAdmin):
+    list_display = (
+        "pattern",
+        "highest_hit",
+        "highest_hit_offset",
+    )
+
+
+class ScanCounterAdmin(admin.ModelAdmin):
+    list_display = (
+        "pattern",
+        "hour",
+        "hits",
+        "misses",
+        "errors",
+    )
+
+
 admin.site.register(Make, MakeAdmin)
 admin.site.register(Vehicle, VehicleAdmin)
 admin.site.register(Color, ColorAdmin)
@@ -223,3 +247,5 @@ admin.site.register(LastPlatechecked, LastPlatecheckedAdmin)
 admin.site.register(UncheckedPlates, UncheckedPlatesAdmin)
 admin.site.register(LastPlateIssued, LastPlateIssuedAdmin)
 admin.site.register(RecheckForAPKPlates, RecheckForAPKPlatesAdmin)
+admin.site.register(PatternProgress, PatternProgressAdmin)
+admin.site.register(ScanCounter, ScanCounterAdmin)
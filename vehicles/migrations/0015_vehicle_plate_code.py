@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vehicles", "0014_vehicle_archived"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vehicle",
+            name="plate_code",
+            field=models.BigIntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
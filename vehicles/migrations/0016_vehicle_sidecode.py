@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vehicles", "0015_vehicle_plate_code"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vehicle",
+            name="sidecode",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=6),
+        ),
+    ]
@@ -2,6 +2,8 @@ import re
 from datetime import date
 from django.db import models
 
+from core.patterns.plate_code import encode_plate
+
 
 class BaseModel(models.Model):
     name = models.CharField(blank=True, null=True, max_length=256)
@@ -61,6 +63,10 @@ class FuelType(BaseModel):
 class Vehicle(BaseModel):
     # General information
     licence_plate = models.CharField(max_length=8, unique=True, db_index=True)
+    # Pattern and position of the plate, see core/patterns/plate_code.py
+    plate_code = models.BigIntegerField(null=True, blank=True, db_index=True)
+    # Sidecode of the plate like "99XXX9", "" for unknown formats
+    sidecode = models.CharField(max_length=6, blank=True, default="", db_index=True)
     make = models.ForeignKey(
         Make,
         on_delete=models.CASCADE,
@@ -159,6 +165,14 @@ class Vehicle(BaseModel):
             except ValueError:
                 print(f"Invalid kW value: {self.kw}")
                 self.hp2 = None
+        # Integer code for range queries per pattern
+        self.plate_code = encode_plate(self.licence_plate)
+        # Compiling the sidecodes loads numpy and the exclusion rules, only
+        # pay for it when a vehicle is saved, not whenever models load
+        from core.patterns.sidecodes import classify_plate
+
+        self.sidecode = classify_plate(self.licence_plate)
+
         # Check if APK date is valid or expired
         if self.apk is not None:
             self.valid_apk = self.apk >= date.today()  # Assign True or False
@@ -7,7 +7,20 @@ from vehicles.models import (
 )
 
 # Util imports
-from core.utilities.licence_plate_formatter import format_license_plate
+from core.utilities.licence_plate_formatter import format_license_plate, format_many
+
+
+class VehicleListPageSerializer(serializers.ListSerializer):
+    """Adds the formatted licence plates of a whole page in one batch."""
+
+    def to_representation(self, data):
+        representations = super().to_representation(data)
+        plates = format_many(
+            representation["licence_plate"] for representation in representations
+        )
+        for representation, plate in zip(representations, plates):
+            representation["formatted_license_plate"] = plate
+        return representations
 
 
 class VehicleListSerializer(serializers.ModelSerializer):
@@ -49,6 +62,8 @@ class VehicleListSerializer(serializers.ModelSerializer):
             "cylinder_count",
             "exported",
         ]
+        # Lists add formatted_license_plate per page, see VehicleListPageSerializer
+        list_serializer_class = VehicleListPageSerializer
 
     def get_display_fuel_types(self, obj):
         # Fetch related fuel types and replace "Undefined" with "-"
@@ -1,15 +1,25 @@
 from django.urls import path
 from vehicles.views import (
     VehicleListView,
+    VehiclePlateSearchView,
     VehicleDetailView,
     UniqueVehicleCategoriesView,
     VehicleCategoryCombinedCountView,
     VehicleYearStatsView,
     VehicleCategoryStatsView,
+    VehicleSidecodeStatsView,
+    ScanCoverageView,
+    BrowserSessionsView,
+    WorkerHeartbeatsView,
 )
 
 urlpatterns = [
     path("vehicles/", VehicleListView.as_view(), name="vehicle-list"),
+    path(
+        "vehicles/plate-search/",
+        VehiclePlateSearchView.as_view(),
+        name="vehicle-plate-search",
+    ),
     path("vehicles/<int:pk>/", VehicleDetailView.as_view(), name="vehicle-detail"),
     path(
         "vehicle-categories/",
@@ -31,4 +41,14 @@ urlpatterns = [
         VehicleCategoryStatsView.as_view(),
         name="vehicle-category-stats",
     ),
+    path(
+        "vehicle-sidecode-stats/",
+        VehicleSidecodeStatsView.as_view(),
+        name="vehicle-sidecode-stats",
+    ),
+    path("scan-coverage/", ScanCoverageView.as_view(), name="scan-coverage"),
+    path("browser-sessions/", BrowserSessionsView.as_view(), name="browser-sessions"),
+    path(
+        "worker-heartbeats/", WorkerHeartbeatsView.as_view(), name="worker-heartbeats"
+    ),
 ]
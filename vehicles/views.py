@@ -2,7 +2,7 @@
 from datetime import datetime
 
 # Djnago imports
-from django.db.models import Count
+from django.db.models import Count, Max, Min
 from django.db.models.functions import ExtractYear
 
 # DRF imports
@@ -12,6 +12,7 @@ from rest_framework.generics import (
 )
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 
 # Custom models imports
 from vehicles.models import (
@@ -28,6 +29,11 @@ from vehicles.serializers import (
 
 # Util imports
 from core.pagination import CustomPageNumberPagination
+from core.patterns.plate_mask import plate_mask_q
+from core.patterns.registry import has_plate_count, pattern_to_source
+from core.utilities.scan_counters import get_scan_coverage
+from core.fetch.supervisor import get_session_metrics
+from core.utilities.worker_control import get_heartbeats
 
 # Other imports
 from collections import defaultdict
@@ -115,6 +121,34 @@ class VehicleListView(ListAPIView):
         return context
 
 
+class VehiclePlateSearchView(ListAPIView):
+    """
+    API endpoint to search vehicles by a wildcard plate mask.
+    `?mask=GP-25-??` or `?mask=*-XXX-9`: `?` is any character and `*` any
+    characters within a group. The mask is compiled to plate_code index ranges.
+    """
+
+    queryset = Vehicle.objects.select_related(
+        "make", "model", "vehicle_category", "color"
+    ).prefetch_related("fuel_type")
+    serializer_class = VehicleListSerializer
+    pagination_class = CustomPageNumberPagination
+
+    def get_queryset(self):
+        mask = self.request.query_params.get("mask", "")
+        try:
+            plate_filter = plate_mask_q(mask)
+        except ValueError as e:
+            raise ValidationError({"mask": str(e)})
+        return self.queryset.filter(plate_filter).order_by("plate_code")
+
+    def get_serializer_context(self):
+        # Pass the request to the serializer's context
+        context = super().get_serializer_context()
+        context["request"] = self.request
+        return context
+
+
 class VehicleDetailView(RetrieveAPIView):
     queryset = Vehicle.objects.select_related(
         "make", "model", "vehicle_category", "color"
@@ -266,3 +300,73 @@ class VehicleCategoryStatsView(APIView):
             )
 
         return Response(results)
+
+
+class VehicleSidecodeStatsView(APIView):
+    """
+    API endpoint to retrieve vehicle counts and first registration ranges per sidecode.
+    """
+
+    def get(self, request, *args, **kwargs):
+        # One grouped query over the indexed sidecode column
+        sidecode_stats = (
+            Vehicle.objects.exclude(archived=True)
+            .values("sidecode")
+            .annotate(
+                count=Count("id"),
+                first_reg_min=Min("first_reg"),
+                first_reg_max=Max("first_reg"),
+            )
+            .order_by("sidecode")
+        )
+
+        results = {}
+        for item in sidecode_stats:
+            results[item["sidecode"] or "Unknown"] = {
+                "count": item["count"],
+                "first_reg_min": item["first_reg_min"],
+                "first_reg_max": item["first_reg_max"],
+            }
+
+        return Response(results)
+
+
+class ScanCoverageView(APIView):
+    """
+    API endpoint to retrieve scan coverage and the projected completion per pattern.
+    Built from the scan state and counters, `?hours=` sets the window of the scan rate.
+    Database sources (FROMDB, UNCHEC, ISSUED) are queues without a size and left out.
+    """
+
+    def get(self, request, *args, **kwargs):
+        try:
+            hours = max(int(request.query_params.get("hours", 24)), 1)
+        except ValueError:
+            raise ValidationError({"hours": "Must be a whole number of hours."})
+
+        results = [
+            get_scan_coverage(pattern, source, hours)
+            for pattern, source in pattern_to_source.items()
+            if has_plate_count(source)
+        ]
+        return Response(results)
+
+
+class BrowserSessionsView(APIView):
+    """
+    API endpoint to retrieve the health metrics of the open scraper sessions.
+    Written by the session supervisor after every lookup.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_session_metrics())
+
+
+class WorkerHeartbeatsView(APIView):
+    """
+    API endpoint to retrieve the last heartbeat of every scraper worker.
+    A worker whose `updated` time stops moving is stuck or gone.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_heartbeats())